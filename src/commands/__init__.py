@@ -48,6 +48,9 @@ def create_command_registry(config: Config) -> CommandRegistry:
     """
     Create and configure the command registry with all available commands.
 
+    Each command class is instantiated exactly once here; the registry reuses
+    these instances for every dispatch.
+
     Args:
         config: Configuration object
 
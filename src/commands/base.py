@@ -6,6 +6,7 @@ Base command pattern classes for Grok Assistant
 Provides the foundation for implementing commands using the command pattern.
 """
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any
@@ -14,12 +15,30 @@ from ..core.config import Config
 from ..core.session import GrokSession
 
 
-@dataclass
+def has_command_prefix(user_input: str, prefix: str) -> bool:
+    """
+    Case-insensitive check that stripped input starts with a lowercase prefix.
+
+    Only the prefix-length head is lowercased, rather than the whole input.
+
+    Args:
+        user_input: User input string
+        prefix: Lowercase command prefix (e.g. "/add ")
+
+    Returns:
+        True if the input starts with the prefix
+    """
+    return user_input.strip()[:len(prefix)].lower() == prefix
+
+
+@dataclass(frozen=True, slots=True)
 class CommandResult:
     """
     Result of a command execution.
+
+    Results are immutable, so the plain ``CommandResult.ok()`` is a shared instance.
     """
-    success: bool
+    success: bool = True
     message: str | None = None
     data: Any | None = None
     should_continue: bool = True  # Whether to continue processing or exit
@@ -27,6 +46,8 @@ class CommandResult:
     @classmethod
     def ok(cls, message: str = None, data: Any = None, should_continue: bool = True) -> 'CommandResult':
         """Create a successful result."""
+        if message is None and data is None and should_continue and cls is CommandResult:
+            return _OK_RESULT
         return cls(success=True, message=message, data=data, should_continue=should_continue)
 
     @classmethod
@@ -39,16 +60,24 @@ class CommandResult:
         """Create an exit result."""
         return cls(success=True, message=message, should_continue=False)
 
-    # Backward compatibility aliases (deprecated)
-    success = ok
-    failure = fail
+
+_OK_RESULT = CommandResult()
 
 
 class BaseCommand(ABC):
     """
     Base class for all commands using the command pattern.
+
+    Commands are stateless apart from the shared config and are registered
+    once per process, so the only per-instance slot is ``config``.
     """
 
+    __slots__ = ('config',)
+
+    # Lowercase patterns matched exactly (e.g. ("/exit", "/quit")); empty for
+    # commands that take arguments and override matches() instead
+    exact_patterns: tuple[str, ...] = ()
+
     def __init__(self, config: Config):
         """
         Initialize the command.
@@ -102,12 +131,48 @@ class BaseCommand(ABC):
         Returns:
             True if the command matches
         """
-        return user_input.strip().startswith(self.get_pattern())
+        if self.exact_patterns:
+            return self.matches_normalized(user_input.strip().lower())
+        return has_command_prefix(user_input, self.get_match_prefix())
+
+    def get_match_prefix(self) -> str:
+        """
+        Get the lowercase text that input must start with for matches() to succeed.
+
+        CommandRegistry only tries a command that takes arguments when the
+        normalized input starts with this prefix. Commands whose matches() is
+        not bound to a prefix should return "" so they are always tried.
+
+        Returns:
+            Lowercase match prefix (the command pattern by default)
+        """
+        return self.get_pattern().lower()
+
+    def matches_normalized(self, normalized: str) -> bool:
+        """
+        Check if already stripped and lowercased input matches this command.
+
+        Used by CommandRegistry, which normalizes the input once per dispatch.
+        Commands overriding matches() must override this too, since the
+        default only checks the match prefix.
+
+        Args:
+            normalized: Stripped, lowercased user input
+
+        Returns:
+            True if the command matches
+        """
+        if self.exact_patterns:
+            return normalized in self.exact_patterns
+        return normalized.startswith(self.get_match_prefix())
 
     def extract_arguments(self, user_input: str) -> str:
         """
         Extract arguments from user input by removing the command pattern.
 
+        The pattern is matched case-insensitively, like command lookup, while
+        the arguments keep their case.
+
         Args:
             user_input: Full user input string
 
@@ -115,8 +180,9 @@ class BaseCommand(ABC):
             Arguments string with command pattern removed
         """
         pattern = self.get_pattern()
-        if user_input.strip().startswith(pattern):
-            return user_input.strip()[len(pattern):].strip()
+        stripped = user_input.strip()
+        if stripped[:len(pattern)].lower() == pattern.lower():
+            return stripped[len(pattern):].strip()
         return ""
 
 
@@ -135,6 +201,15 @@ class CommandRegistry:
         self.config = config
         self.commands: list[BaseCommand] = []
 
+        # Exact pattern -> (registration position, command), first registration
+        # wins. Patterns are interned like the normalized input, so a lookup
+        # hit compares by identity.
+        self._exact_index: dict[str, tuple[int, BaseCommand]] = {}
+        # Character trie over the match prefixes of commands matched by their
+        # own matches(); the "" key of a node holds the (registration position,
+        # command) pairs whose prefix ends there
+        self._prefix_trie: dict[str, Any] = {}
+
     def register(self, command: BaseCommand) -> None:
         """
         Register a command.
@@ -142,22 +217,76 @@ class CommandRegistry:
         Args:
             command: Command instance to register
         """
+        position = len(self.commands)
         self.commands.append(command)
 
+        if command.exact_patterns:
+            for pattern in command.exact_patterns:
+                self._exact_index.setdefault(sys.intern(pattern), (position, command))
+        else:
+            node = self._prefix_trie
+            for char in command.get_match_prefix():
+                node = node.setdefault(char, {})
+            node.setdefault("", []).append((position, command))
+
     def find_command(self, user_input: str) -> BaseCommand | None:
         """
         Find a command that matches the user input.
 
+        Exact commands are found with one dict lookup. Commands that take
+        arguments are found by walking the prefix trie along the input, and
+        only those whose prefix the input starts with are tried, in
+        registration order. Registration order still decides ties.
+
+        All commands start with "/", so other input (a normal prompt) is
+        rejected before it is normalized.
+
         Args:
             user_input: User input string
 
         Returns:
             Matching command or None
         """
-        for command in self.commands:
-            if command.matches(user_input):
+        if not user_input.lstrip().startswith("/"):
+            return None
+
+        normalized = self.normalize_input(user_input)
+        exact = self._exact_index.get(normalized)
+
+        candidates = []
+        node = self._prefix_trie
+        for char in normalized:
+            candidates.extend(node.get("", ()))
+            node = node.get(char)
+            if node is None:
+                break
+        else:
+            candidates.extend(node.get("", ()))
+        candidates.sort(key=lambda candidate: candidate[0])
+
+        for position, command in candidates:
+            if exact is not None and position > exact[0]:
+                break
+            if command.matches_normalized(normalized):
                 return command
-        return None
+
+        return exact[1] if exact is not None else None
+
+    @staticmethod
+    def normalize_input(user_input: str) -> str:
+        """
+        Normalize user input once for command matching.
+
+        The stripped, lowercased input is interned so repeated commands
+        (e.g. "/context" typed again) resolve to the same string object.
+
+        Args:
+            user_input: Raw user input string
+
+        Returns:
+            Interned, stripped and lowercased input
+        """
+        return sys.intern(user_input.strip().lower())
 
     def execute_command(self, user_input: str, session: GrokSession) -> CommandResult | None:
         """
@@ -6,74 +6,126 @@ Context management commands for Grok Assistant
 Commands that handle conversation context, model switching, etc.
 """
 
+from rich.console import Group
+from rich.text import Text
+
 from ..core.session import GrokSession
+from ..ui import console as ui_console
+from ..ui.formatters import make_table
 from .base import BaseCommand, CommandResult
 
+# Table column layouts as (header, style)
+_CONTEXT_COLUMNS = (("Metric", "bright_cyan"), ("Value", "white"))
+_CONTEXT_MODE_COLUMNS = (
+    ("Mode", "bright_cyan"),
+    ("Description", "white"),
+    ("Best For", "green"),
+    ("Active", "yellow"),
+)
+
+# /context-mode rows as (mode, description, best for)
+_CONTEXT_MODES = (
+    ("cache_optimized", "Sequential context with periodic truncation", "Long conversations, preserving history"),
+    ("smart_truncation", "Immediate turn summarization at 70% limit", "Memory-efficient, frequent API calls"),
+)
+
+_SEPARATOR = "─" * 20
+_SEPARATOR_ROW = (_SEPARATOR, _SEPARATOR)
+
+# Pre-styled /context output, built once so rich skips markup parsing per call
+_STATUS_CRITICAL = Text("🔴 Critical", style="bold red")
+_STATUS_HIGH = Text("🟡 High", style="bold yellow")
+_STATUS_NORMAL = Text("🟢 Normal", style="bold green")
+
+_CRITICAL_RECOMMENDATION = Text.from_markup(
+    "\n[bold red]⚠ Context is critical![/bold red]\n"
+    "[dim]Consider using /clear context to reduce token usage.[/dim]"
+)
+_HIGH_RECOMMENDATION = Text.from_markup(
+    "\n[bold yellow]⚠ Context is getting high.[/bold yellow]\n"
+    "[dim]Monitor usage to avoid context limits.[/dim]"
+)
+_MOUNTED_FILES_TIP = Text.from_markup(
+    "\n[dim]💡 Mounted files persist across context truncations.[/dim]\n"
+    "[dim]   Use /remove <file> to unmount files when no longer needed.[/dim]"
+)
+
+# Constant footer of /context-mode
+_CONTEXT_MODE_COMMANDS = Text.from_markup(
+    "\n[bold]Commands:[/bold]\n"
+    "  [cyan]/sequential[/cyan] - Switch to cache_optimized mode\n"
+    "  [cyan]/smart[/cyan] - Switch to smart_truncation mode"
+)
+
 
 class ContextCommand(BaseCommand):
     """Handle /context command to show context usage statistics."""
 
+    exact_patterns = ("/context",)
+
     def get_pattern(self) -> str:
         return "/context"
 
     def get_description(self) -> str:
         return "Show context usage statistics"
 
-    def matches(self, user_input: str) -> bool:
-        return user_input.strip().lower() == "/context"
-
     def execute(self, user_input: str, session: GrokSession) -> CommandResult:
-        from rich.table import Table
-
-        from ..ui.console import get_console
-
-        console = get_console()
+        console = ui_console.get_console()
         context_info = session.get_context_info()
 
-        context_table = Table(title="📊 Context Usage Statistics", show_header=True, header_style="bold bright_blue")
-        context_table.add_column("Metric", style="bright_cyan")
-        context_table.add_column("Value", style="white")
-
-        context_table.add_row("Model", context_info['model'])
-        context_table.add_row("Messages", str(context_info['messages']))
-        context_table.add_row("Estimated Tokens", f"{context_info['estimated_tokens']:,}")
-        context_table.add_row("Max Tokens", f"{context_info['max_tokens']:,}")
-        context_table.add_row("Usage %", f"{context_info['token_usage_percent']:.1f}%")
+        rows = [
+            ("Model", context_info['model']),
+            ("Messages", str(context_info['messages'])),
+            ("Estimated Tokens", f"{context_info['estimated_tokens']:,}"),
+            ("Max Tokens", f"{context_info['max_tokens']:,}"),
+            ("Usage %", f"{context_info['token_usage_percent']:.1f}%"),
+        ]
 
         # Show mounted files information
         if 'mounted_files_count' in context_info:
             mounted_count = context_info.get('mounted_files_count', 0)
             mounted_tokens = context_info.get('mounted_files_tokens', 0)
-            context_table.add_row("─" * 20, "─" * 20)  # Separator
-            context_table.add_row("Mounted Files", str(mounted_count))
+            rows.append(_SEPARATOR_ROW)
+            rows.append(("Mounted Files", str(mounted_count)))
             if mounted_count > 0:
-                context_table.add_row("Mounted Files Tokens", f"{mounted_tokens:,}")
+                rows.append(("Mounted Files Tokens", f"{mounted_tokens:,}"))
 
         # Color-code status
         if context_info['critical_limit']:
-            status = "[bold red]🔴 Critical[/bold red]"
+            status = _STATUS_CRITICAL
         elif context_info['approaching_limit']:
-            status = "[bold yellow]🟡 High[/bold yellow]"
+            status = _STATUS_HIGH
         else:
-            status = "[bold green]🟢 Normal[/bold green]"
+            status = _STATUS_NORMAL
 
-        context_table.add_row("─" * 20, "─" * 20)  # Separator
-        context_table.add_row("Status", status)
+        rows.append(_SEPARATOR_ROW)
+        rows.append(("Status", status))
 
-        console.print(context_table)
+        notes = []
 
         # Show recommendations
         if context_info['critical_limit']:
-            console.print("\n[bold red]⚠ Context is critical![/bold red]")
-            console.print("[dim]Consider using /clear context to reduce token usage.[/dim]")
+            notes.append(_CRITICAL_RECOMMENDATION)
         elif context_info['approaching_limit']:
-            console.print("\n[bold yellow]⚠ Context is getting high.[/bold yellow]")
-            console.print("[dim]Monitor usage to avoid context limits.[/dim]")
+            notes.append(_HIGH_RECOMMENDATION)
 
         # Show mounted files tip if any exist
         if context_info.get('mounted_files_count', 0) > 0:
-            console.print("\n[dim]💡 Mounted files persist across context truncations.[/dim]")
-            console.print("[dim]   Use /remove <file> to unmount files when no longer needed.[/dim]")
+            notes.append(_MOUNTED_FILES_TIP)
+
+        # Piped output: skip table layout and styling entirely
+        if not console.is_terminal:
+            lines = [f"{label}: {value}" for label, value in rows if value is not _SEPARATOR]
+            lines.extend(note.plain for note in notes)
+            console.print("\n".join(lines), markup=False, highlight=False, soft_wrap=True)
+            return CommandResult.ok()
+
+        context_table = make_table("📊 Context Usage Statistics", _CONTEXT_COLUMNS)
+        for label, value in rows:
+            context_table.add_row(label, value)
+
+        # Collect everything into one renderable so the console is written once
+        console.print(Group(context_table, *notes))
 
         return CommandResult.ok()
 
@@ -81,20 +133,18 @@ class ContextCommand(BaseCommand):
 class LogCommand(BaseCommand):
     """Handle /log command to show recent conversation history."""
 
+    exact_patterns = ("/log",)
+
     def get_pattern(self) -> str:
         return "/log"
 
     def get_description(self) -> str:
         return "Show recent conversation history"
 
-    def matches(self, user_input: str) -> bool:
-        return user_input.strip().lower() == "/log"
-
     def execute(self, user_input: str, session: GrokSession) -> CommandResult:
-        from ..ui.console import get_console
         from ..ui.formatters import format_conversation_log
 
-        console = get_console()
+        console = ui_console.get_console()
         conversation_history = session.get_conversation_history()
 
         if len(conversation_history) <= 1:
@@ -108,6 +158,16 @@ class LogCommand(BaseCommand):
             console.print("[yellow]No user/assistant messages in recent history.[/yellow]")
             return CommandResult.ok()
 
+        # Piped output: plain numbered lines without panel or role styling
+        if not console.is_terminal:
+            console.print(
+                "\n".join(f"{i}. {msg['role']}: {msg['content']}" for i, msg in enumerate(recent_messages, 1)),
+                markup=False,
+                highlight=False,
+                soft_wrap=True,
+            )
+            return CommandResult.ok()
+
         format_conversation_log(recent_messages, console)
         return CommandResult.ok()
 
@@ -115,30 +175,27 @@ class LogCommand(BaseCommand):
 class ReasonerCommand(BaseCommand):
     """Handle /reasoner or /r command to toggle between models."""
 
+    exact_patterns = ("/reasoner", "/r")
+
     def get_pattern(self) -> str:
         return "/reasoner"
 
     def get_description(self) -> str:
         return "Toggle between default and reasoning model (alias: /r)"
 
-    def matches(self, user_input: str) -> bool:
-        user_cmd = user_input.strip().lower()
-        return user_cmd == "/reasoner" or user_cmd == "/r"
-
     def execute(self, user_input: str, session: GrokSession) -> CommandResult:
-        from ..ui.console import get_console
+        console = ui_console.get_console()
 
-        console = get_console()
+        # Toggle: back to default from the reasoner, otherwise to the reasoner
+        to_reasoner = session.model != self.config.reasoner_model
+        target = self.config.reasoner_model if to_reasoner else self.config.default_model
+        session.switch_model(target)
 
-        if session.model == self.config.reasoner_model:
-            # Switch back to default model
-            session.switch_model(self.config.default_model)
-            console.print(f"[bold green]✓[/bold green] Switched to {self.config.default_model} model")
-        else:
-            # Switch to reasoner model
-            session.switch_model(self.config.reasoner_model)
-            console.print(f"[bold green]✓[/bold green] Switched to {self.config.reasoner_model} reasoning model")
+        if to_reasoner:
+            console.print(f"[bold green]✓[/bold green] Switched to {target} reasoning model")
             console.print("[dim]This model provides enhanced reasoning capabilities.[/dim]")
+        else:
+            console.print(f"[bold green]✓[/bold green] Switched to {target} model")
 
         return CommandResult.ok()
 
@@ -146,19 +203,16 @@ class ReasonerCommand(BaseCommand):
 class DefaultModelCommand(BaseCommand):
     """Handle switching back to default model."""
 
+    exact_patterns = ("/default",)
+
     def get_pattern(self) -> str:
         return "/default"
 
     def get_description(self) -> str:
         return "Switch back to default model"
 
-    def matches(self, user_input: str) -> bool:
-        return user_input.strip().lower() == "/default"
-
     def execute(self, user_input: str, session: GrokSession) -> CommandResult:
-        from ..ui.console import get_console
-
-        console = get_console()
+        console = ui_console.get_console()
 
         if session.model == self.config.default_model:
             console.print(f"[yellow]Already using {self.config.default_model} model.[/yellow]")
@@ -174,55 +228,39 @@ class DefaultModelCommand(BaseCommand):
 class ContextModeCommand(BaseCommand):
     """Handle /context-mode command to show current context mode and options."""
 
+    exact_patterns = ("/context-mode",)
+
     def get_pattern(self) -> str:
         return "/context-mode"
 
     def get_description(self) -> str:
         return "Show current context management mode and toggle options"
 
-    def matches(self, user_input: str) -> bool:
-        return user_input.strip().lower() == "/context-mode"
-
     def execute(self, user_input: str, session: GrokSession) -> CommandResult:
-        from rich.table import Table
-
-        from ..ui.console import get_console
-
-        console = get_console()
+        console = ui_console.get_console()
         current_mode = session.get_context_mode()
 
-        # Display current mode
-        console.print(f"\n[bold cyan]Current Context Mode:[/bold cyan] {current_mode}")
+        # Piped output: skip table layout and styling entirely
+        if not console.is_terminal:
+            lines = [f"Current Context Mode: {current_mode}"]
+            for mode, description, best_for in _CONTEXT_MODES:
+                active = " (active)" if mode == current_mode else ""
+                lines.append(f"{mode}{active}: {description}; best for {best_for}")
+            lines.append(_CONTEXT_MODE_COMMANDS.plain)
+            console.print("\n".join(lines), markup=False, highlight=False, soft_wrap=True)
+            return CommandResult.ok()
 
         # Create mode comparison table
-        mode_table = Table(title="Context Management Modes", show_header=True, header_style="bold bright_blue")
-        mode_table.add_column("Mode", style="bright_cyan")
-        mode_table.add_column("Description", style="white")
-        mode_table.add_column("Best For", style="green")
-        mode_table.add_column("Active", style="yellow")
-
-        cache_active = "✓" if current_mode == "cache_optimized" else ""
-        smart_active = "✓" if current_mode == "smart_truncation" else ""
-
-        mode_table.add_row(
-            "cache_optimized",
-            "Sequential context with periodic truncation",
-            "Long conversations, preserving history",
-            cache_active
-        )
-        mode_table.add_row(
-            "smart_truncation",
-            "Immediate turn summarization at 70% limit",
-            "Memory-efficient, frequent API calls",
-            smart_active
-        )
-
-        console.print(mode_table)
-
-        # Show commands to switch modes
-        console.print("\n[bold]Commands:[/bold]")
-        console.print("  [cyan]/sequential[/cyan] - Switch to cache_optimized mode")
-        console.print("  [cyan]/smart[/cyan] - Switch to smart_truncation mode")
+        mode_table = make_table("Context Management Modes", _CONTEXT_MODE_COLUMNS)
+        for mode, description, best_for in _CONTEXT_MODES:
+            mode_table.add_row(mode, description, best_for, "✓" if mode == current_mode else "")
+
+        # Current mode, mode table and switch commands rendered in a single print
+        console.print(Group(
+            Text.from_markup(f"\n[bold cyan]Current Context Mode:[/bold cyan] {current_mode}"),
+            mode_table,
+            _CONTEXT_MODE_COMMANDS,
+        ))
 
         return CommandResult.ok()
 
@@ -230,19 +268,16 @@ class ContextModeCommand(BaseCommand):
 class SequentialContextCommand(BaseCommand):
     """Handle /sequential command to switch to cache-optimized context mode."""
 
+    exact_patterns = ("/sequential",)
+
     def get_pattern(self) -> str:
         return "/sequential"
 
     def get_description(self) -> str:
         return "Switch to cache-optimized (sequential) context mode"
 
-    def matches(self, user_input: str) -> bool:
-        return user_input.strip().lower() == "/sequential"
-
     def execute(self, user_input: str, session: GrokSession) -> CommandResult:
-        from ..ui.console import get_console
-
-        console = get_console()
+        console = ui_console.get_console()
         current_mode = session.get_context_mode()
 
         if current_mode == "cache_optimized":
@@ -260,19 +295,16 @@ class SequentialContextCommand(BaseCommand):
 class SmartTruncationCommand(BaseCommand):
     """Handle /smart command to switch to smart truncation context mode."""
 
+    exact_patterns = ("/smart",)
+
     def get_pattern(self) -> str:
         return "/smart"
 
     def get_description(self) -> str:
         return "Switch to smart truncation context mode"
 
-    def matches(self, user_input: str) -> bool:
-        return user_input.strip().lower() == "/smart"
-
     def execute(self, user_input: str, session: GrokSession) -> CommandResult:
-        from ..ui.console import get_console
-
-        console = get_console()
+        console = ui_console.get_console()
         current_mode = session.get_context_mode()
 
         if current_mode == "smart_truncation":
@@ -290,19 +322,16 @@ class SmartTruncationCommand(BaseCommand):
 class CoderCommand(BaseCommand):
     """Handle /coder command to switch to grok-code-fast-1 model."""
 
+    exact_patterns = ("/coder",)
+
     def get_pattern(self) -> str:
         return "/coder"
 
     def get_description(self) -> str:
         return "Switch to grok-code-fast-1 coding model"
 
-    def matches(self, user_input: str) -> bool:
-        return user_input.strip().lower() == "/coder"
-
     def execute(self, user_input: str, session: GrokSession) -> CommandResult:
-        from ..ui.console import get_console
-
-        console = get_console()
+        console = ui_console.get_console()
 
         if session.model == self.config.coder_model:
             console.print(f"[yellow]Already using {self.config.coder_model} model.[/yellow]")
@@ -319,19 +348,16 @@ class CoderCommand(BaseCommand):
 class Grok4Command(BaseCommand):
     """Handle /grok-4 command to switch to legacy grok-4-fast-non-reasoning model."""
 
+    exact_patterns = ("/grok-4",)
+
     def get_pattern(self) -> str:
         return "/grok-4"
 
     def get_description(self) -> str:
         return "Switch to legacy grok-4-fast-non-reasoning model"
 
-    def matches(self, user_input: str) -> bool:
-        return user_input.strip().lower() == "/grok-4"
-
     def execute(self, user_input: str, session: GrokSession) -> CommandResult:
-        from ..ui.console import get_console
-
-        console = get_console()
+        console = ui_console.get_console()
 
         if session.model == self.config.grok4_model:
             console.print(f"[yellow]Already using {self.config.grok4_model} model.[/yellow]")
@@ -348,19 +374,16 @@ class Grok4Command(BaseCommand):
 class Grok4ReasonerCommand(BaseCommand):
     """Handle /4r command to switch to legacy grok-4-fast-reasoning model."""
 
+    exact_patterns = ("/4r",)
+
     def get_pattern(self) -> str:
         return "/4r"
 
     def get_description(self) -> str:
         return "Switch to legacy grok-4-fast-reasoning model"
 
-    def matches(self, user_input: str) -> bool:
-        return user_input.strip().lower() == "/4r"
-
     def execute(self, user_input: str, session: GrokSession) -> CommandResult:
-        from ..ui.console import get_console
-
-        console = get_console()
+        console = ui_console.get_console()
 
         if session.model == self.config.grok4_reasoner_model:
             console.print(f"[yellow]Already using {self.config.grok4_reasoner_model} model.[/yellow]")
@@ -377,19 +400,16 @@ class Grok4ReasonerCommand(BaseCommand):
 class MaxContextCommand(BaseCommand):
     """Handle /max command to toggle extended context (2M tokens) for grok-4-1 models."""
 
+    exact_patterns = ("/max",)
+
     def get_pattern(self) -> str:
         return "/max"
 
     def get_description(self) -> str:
         return "Toggle 2M context window for grok-4-1 models (default: 128K)"
 
-    def matches(self, user_input: str) -> bool:
-        return user_input.strip().lower() == "/max"
-
     def execute(self, user_input: str, session: GrokSession) -> CommandResult:
-        from ..ui.console import get_console
-
-        console = get_console()
+        console = ui_console.get_console()
 
         # Toggle the extended context setting
         new_state = not self.config.use_extended_context
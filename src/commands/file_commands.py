@@ -6,10 +6,23 @@ File operation commands for Grok Assistant
 Commands that handle file operations like add, remove, folder changes, etc.
 """
 
+import os
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from ..core.session import GrokSession
-from .base import BaseCommand, CommandResult
+from ..ui import console as ui_console
+from ..utils import file_utils
+from .base import BaseCommand, CommandResult, has_command_prefix
+
+# Concurrent reads when mounting a directory; batches bound the reads wasted
+# past the size limit
+_READ_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+_READ_BATCH_SIZE = 32
+# Files skipped for size before /add <dir> stops walking; once this many
+# don't fit, the remaining budget is rarely worth a full tree scan
+_MAX_SKIPPED_FILES = 64
 
 
 class AddCommand(BaseCommand):
@@ -22,16 +35,56 @@ class AddCommand(BaseCommand):
         return "Add file/directory to context with fuzzy matching"
 
     def matches(self, user_input: str) -> bool:
-        return user_input.strip().lower().startswith(self.config.ADD_COMMAND_PREFIX)
+        return has_command_prefix(user_input, self.config.ADD_COMMAND_PREFIX)
+
+    def matches_normalized(self, normalized: str) -> bool:
+        return normalized.startswith(self.config.ADD_COMMAND_PREFIX)
+
+    def get_match_prefix(self) -> str:
+        return self.config.ADD_COMMAND_PREFIX
+
+    def _walk_files(self, root: str) -> Iterator[tuple[str, int]]:
+        """
+        Yield (path, size in bytes) for the non-excluded files under root in
+        os.walk (top-down) order.
+
+        Uses os.scandir so entry types come from the directory listing; the
+        size comes from DirEntry.stat(). Symlinked directories are not followed.
+        """
+        excluded_files = self.config.excluded_files
+        excluded_extensions = self.config.excluded_extensions
+
+        stack = [root]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    subdirs = []
+                    for entry in entries:
+                        name = entry.name
+                        if name in excluded_files:
+                            continue
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        if is_dir:
+                            if not entry.is_symlink():
+                                subdirs.append(entry.path)
+                        elif os.path.splitext(name)[1].lower() not in excluded_extensions:
+                            try:
+                                size = entry.stat().st_size
+                            except OSError:
+                                continue
+                            yield entry.path, size
+            except OSError:
+                continue
+
+            # Reversed so subdirectories are visited in listing order
+            stack.extend(reversed(subdirs))
 
     def execute(self, user_input: str, session: GrokSession) -> CommandResult:
-        import os
-
-        from ..ui.console import get_console, get_prompt_session
-        from ..utils.file_utils import find_best_matching_file, normalize_path, safe_file_read
-
-        console = get_console()
-        prompt_session = get_prompt_session()
+        console = ui_console.get_console()
+        prompt_session = ui_console.get_prompt_session()
 
         path_to_add = user_input[len(self.config.ADD_COMMAND_PREFIX):].strip()
 
@@ -46,7 +99,7 @@ class AddCommand(BaseCommand):
         except (FileNotFoundError, OSError):
             # 2. If direct path fails, try fuzzy finding
             console.print(f"[dim]Path '{path_to_add}' not found directly, attempting fuzzy search...[/dim]")
-            fuzzy_match = find_best_matching_file(self.config.base_dir, path_to_add, self.config)
+            fuzzy_match = file_utils.find_best_matching_file(self.config.base_dir, path_to_add, self.config)
 
             if fuzzy_match:
                 # Optional: Confirm with user for better UX
@@ -67,12 +120,12 @@ class AddCommand(BaseCommand):
 
         # 3. Mount file(s) to context
         try:
-            normalized_path = normalize_path(normalized_path, self.config)
+            normalized_path = file_utils.normalize_path(normalized_path, self.config)
             path_obj = Path(normalized_path)
 
             if path_obj.is_file():
                 # Single file - mount it
-                read_result = safe_file_read(normalized_path, config=self.config)
+                read_result = file_utils.safe_file_read(normalized_path, config=self.config)
 
                 if read_result['success']:
                     relative_path = path_obj.relative_to(self.config.base_dir)
@@ -86,40 +139,42 @@ class AddCommand(BaseCommand):
                 # Directory - mount all valid files
                 files_added = 0
                 total_size = 0
-
-                # Walk through directory
-                for root, dirs, files in os.walk(path_obj):
-                    # Filter out excluded directories
-                    dirs[:] = [d for d in dirs if d not in self.config.excluded_files]
-
-                    for file in files:
-                        file_path_obj = Path(root) / file
-
-                        # Skip excluded files
-                        if file in self.config.excluded_files:
-                            continue
-
-                        # Skip excluded extensions
-                        if file_path_obj.suffix.lower() in self.config.excluded_extensions:
-                            continue
-
-                        # Check size limits
-                        if total_size > self.config.max_multiple_read_size:
+                skipped = 0
+                max_size = self.config.max_multiple_read_size
+                max_files = self.config.max_files_in_add_dir
+
+                def read(file_path: str) -> dict:
+                    return file_utils.safe_file_read(file_path, config=self.config)
+
+                # Admit files by their size on disk, so files that would exceed
+                # the size budget are skipped without being read. Admitted files
+                # are read concurrently in small batches and mounted in walk order.
+                files = self._walk_files(normalized_path)
+                with ThreadPoolExecutor(max_workers=_READ_WORKERS) as executor:
+                    while files_added < max_files and total_size < max_size and skipped < _MAX_SKIPPED_FILES:
+                        batch_limit = min(_READ_BATCH_SIZE, max_files - files_added)
+                        batch = []
+                        for file_path, size in files:
+                            if total_size + size > max_size:
+                                skipped += 1
+                                if skipped >= _MAX_SKIPPED_FILES:
+                                    break
+                                continue
+                            batch.append((file_path, size))
+                            total_size += size
+                            if len(batch) >= batch_limit:
+                                break
+                        if not batch:
                             break
 
-                        if files_added >= self.config.max_files_in_add_dir:
-                            break
-
-                        # Read and mount file
-                        read_result = safe_file_read(str(file_path_obj), config=self.config)
-
-                        if read_result['success']:
-                            session.mount_file(str(file_path_obj), read_result['content'])
-                            files_added += 1
-                            total_size += len(read_result['content'])
-
-                    if files_added >= self.config.max_files_in_add_dir or total_size > self.config.max_multiple_read_size:
-                        break
+                        results = executor.map(read, [file_path for file_path, _ in batch])
+                        for (file_path, size), read_result in zip(batch, results, strict=True):
+                            if read_result['success']:
+                                session.mount_file(file_path, read_result['content'])
+                                files_added += 1
+                            else:
+                                # Unreadable files don't use up the budget
+                                total_size -= size
 
                 relative_dir = path_obj.relative_to(self.config.base_dir)
                 console.print(f"[bold green]✓[/bold green] Mounted {files_added} files from directory '[bright_cyan]{relative_dir}[/bright_cyan]'")
@@ -143,13 +198,13 @@ class RemoveCommand(BaseCommand):
         return "Remove file from context"
 
     def matches(self, user_input: str) -> bool:
-        return user_input.strip().lower().startswith("/remove ")
+        return has_command_prefix(user_input, "/remove ")
 
-    def execute(self, user_input: str, session: GrokSession) -> CommandResult:
-        from ..ui.console import get_console
-        from ..utils.file_utils import find_best_matching_file
+    def matches_normalized(self, normalized: str) -> bool:
+        return normalized.startswith("/remove ")
 
-        console = get_console()
+    def execute(self, user_input: str, session: GrokSession) -> CommandResult:
+        console = ui_console.get_console()
         path_to_remove = user_input[len("/remove "):].strip()
 
         # Try direct path first
@@ -159,7 +214,7 @@ class RemoveCommand(BaseCommand):
                 normalized_path = str(p)
             else:
                 # Try fuzzy finding
-                fuzzy_match = find_best_matching_file(self.config.base_dir, path_to_remove, self.config)
+                fuzzy_match = file_utils.find_best_matching_file(self.config.base_dir, path_to_remove, self.config)
                 if fuzzy_match:
                     normalized_path = fuzzy_match
                 else:
@@ -167,7 +222,7 @@ class RemoveCommand(BaseCommand):
                     return CommandResult.fail("Path not found")
         except (FileNotFoundError, OSError):
             console.print(f"[bold red]✗[/bold red] Path does not exist: '[bright_cyan]{path_to_remove}[/bright_cyan]'")
-            return CommandResult.failure("Path not found")
+            return CommandResult.fail("Path not found")
 
         # Unmount file from context
         relative_path = Path(normalized_path).relative_to(self.config.base_dir)
@@ -191,14 +246,16 @@ class FolderCommand(BaseCommand):
         return "Change working directory"
 
     def matches(self, user_input: str) -> bool:
-        return user_input.strip().lower().startswith("/folder ")
+        return has_command_prefix(user_input, "/folder ")
+
+    def matches_normalized(self, normalized: str) -> bool:
+        return normalized.startswith("/folder ")
 
     def execute(self, user_input: str, session: GrokSession) -> CommandResult:
         from ..services.directory_service import DirectoryService
-        from ..ui.console import get_console, get_prompt_session
 
-        console = get_console()
-        prompt_session = get_prompt_session()
+        console = ui_console.get_console()
+        prompt_session = ui_console.get_prompt_session()
         folder_path = user_input[len("/folder "):].strip()
 
         # Use DirectoryService for path resolution and validation
@@ -218,11 +275,11 @@ class FolderCommand(BaseCommand):
 
         # Handle memory integration before changing directory
         memory_manager = session.get_memory_manager()
-        has_existing_memories = memory_manager.has_directory_memories(new_path)
+        existing_memories = memory_manager.get_directory_memories(new_path)
 
-        if has_existing_memories:
+        if existing_memories:
             # Directory has existing memories - ask user if they want to use them
-            memory_count = len(memory_manager.get_directory_memories(new_path))
+            memory_count = len(existing_memories)
             console.print(f"[yellow]Found {memory_count} existing memories in target directory.[/yellow]")
 
             use_memories = prompt_session.prompt("Use existing memories? (Y/n): ", default="y").strip().lower()
@@ -243,6 +300,8 @@ class FolderCommand(BaseCommand):
         result = directory_service.change_directory(new_path, session)
 
         if result.success:
+            # Fuzzy lookups now search the new base directory
+            file_utils.invalidate_fuzzy_candidates(result.old_path)
             console.print("[bold green]✓[/bold green] Changed working directory")
             console.print(f"[dim]From:[/dim] [bright_cyan]{result.old_path}[/bright_cyan]")
             console.print(f"[dim]To:[/dim] [bright_cyan]{result.new_path}[/bright_cyan]")
@@ -261,4 +320,4 @@ class FolderCommand(BaseCommand):
             if result.memory_info.get("has_existing_memories"):
                 console.print("[dim]Using existing directory memories[/dim]")
 
-        return CommandResult.success()
+        return CommandResult.ok()
@@ -6,147 +6,194 @@ Memory management commands for Grok Assistant
 Interactive memory management with clean command structure.
 """
 
+import json
+from datetime import datetime
+from pathlib import Path
+
 from rich.table import Table
 
 from ..core.session import GrokSession
+from ..ui import console as ui_console
+from ..ui.formatters import make_table
 from .base import BaseCommand, CommandResult
 
+# Memory table column layouts as (header, style)
+_MEMORY_COLUMNS = (("ID", "cyan"), ("Type", "green"), ("Content", "white"), ("Created", "dim"))
+_ALL_MEMORY_COLUMNS = _MEMORY_COLUMNS[:2] + (("Scope", "yellow"),) + _MEMORY_COLUMNS[2:]
+_STATISTICS_COLUMNS = (("Metric", "cyan"), ("Value", "white"))
+
+# Cache key for the statistics view, alongside the memory lists keyed by getter
+_STATISTICS_KEY = "statistics"
+
+# Memories shown per table page
+_MEMORY_PAGE_SIZE = 50
+
+# Menus are printed whole, in one console.print() each
+_MAIN_MENU = "\n".join((
+    "\n[bold cyan]Memory Management[/bold cyan]",
+    "1. List memories (current directory + global)",
+    "2. List global memories only",
+    "3. List directory memories only",
+    "4. Save new memory",
+    "5. Remove memory",
+    "6. Clear all memories",
+    "7. Import memories from another directory",
+    "8. Export memories",
+    "9. Memory statistics",
+    "q. Quit",
+))
+_MEMORY_TYPE_MENU = "\n".join((
+    "\nMemory types:",
+    "1. user_preference - User's preferred tools/patterns",
+    "2. architectural_decision - Project structure/tech choices",
+    "3. important_fact - Critical project information",
+    "4. project_context - Specific constraints/requirements",
+))
+_MEMORY_TYPES = {
+    "1": "user_preference",
+    "2": "architectural_decision",
+    "3": "important_fact",
+    "4": "project_context",
+}
+_MEMORY_TYPE_NAMES = {memory_type: memory_type.replace("_", " ").title()
+                      for memory_type in _MEMORY_TYPES.values()}
+
+
+def _memory_type_name(memory_type: str) -> str:
+    """Display name for a memory type, e.g. 'User Preference'."""
+    name = _MEMORY_TYPE_NAMES.get(memory_type)
+    return name if name is not None else memory_type.replace("_", " ").title()
+
+
+def _memory_row(memory: dict, content_limit: int, include_scope: bool = False) -> tuple[str, ...]:
+    """Format a memory as a table row, reading each field once."""
+    content = memory.get("content", "")
+    if len(content) > content_limit:
+        content = content[:content_limit] + "..."
+    created = memory.get("created")
+    row = (memory.get("id", ""), _memory_type_name(memory.get("type", "")))
+    if include_scope:
+        row += (memory.get("scope", "directory"),)
+    return row + (content, created[:10] if created else "")
+
 
 class MemoryCommand(BaseCommand):
     """Interactive memory management command."""
 
+    exact_patterns = ("/memory",)
+
     def get_pattern(self) -> str:
         return "/memory"
 
     def get_description(self) -> str:
         return "Interactive memory management"
 
-    def matches(self, user_input: str) -> bool:
-        return user_input.strip().lower() == "/memory"
-
     def execute(self, user_input: str, session: GrokSession) -> CommandResult:
         """Execute the interactive memory command."""
-        from ..ui.console import get_console, get_prompt_session
-
-        console = get_console()
-        prompt_session = get_prompt_session()
+        console = ui_console.get_console()
+        prompt_session = ui_console.get_prompt_session()
         memory_manager = session.get_memory_manager()
 
+        # Memory lists fetched for this menu session, dropped after any change
+        memories_cache = {}
+
+        def cached(fetch, key=None):
+            """Return fetch(), reusing its result until the memories change."""
+            if key is None:
+                key = fetch
+            if key not in memories_cache:
+                memories_cache[key] = fetch()
+            return memories_cache[key]
+
+        # Menu choice -> (action, whether it can change the memories)
+        actions = {
+            '1': (lambda: self._list_all_memories(console, prompt_session, memory_manager, cached), False),
+            '2': (lambda: self._list_global_memories(console, prompt_session, memory_manager, cached), False),
+            '3': (lambda: self._list_directory_memories(console, prompt_session, memory_manager, cached), False),
+            '4': (lambda: self._save_new_memory(console, prompt_session, memory_manager), True),
+            '5': (lambda: self._remove_memory(console, prompt_session, memory_manager, cached), True),
+            '6': (lambda: self._clear_memories(console, prompt_session, memory_manager, cached), True),
+            '7': (lambda: self._import_memories(console, prompt_session, memory_manager), True),
+            '8': (lambda: self._export_memories(console, memory_manager), False),
+            '9': (lambda: self._show_statistics(console, memory_manager, cached), False),
+        }
+
         while True:
             # Display memory management menu
-            console.print("\n[bold cyan]Memory Management[/bold cyan]")
-            console.print("1. List memories (current directory + global)")
-            console.print("2. List global memories only")
-            console.print("3. List directory memories only")
-            console.print("4. Save new memory")
-            console.print("5. Remove memory")
-            console.print("6. Clear all memories")
-            console.print("7. Import memories from another directory")
-            console.print("8. Export memories")
-            console.print("9. Memory statistics")
-            console.print("q. Quit")
+            console.print(_MAIN_MENU)
 
             choice = prompt_session.prompt("\nChoose option (1-9) or 'q' to quit: ").strip().lower()
 
             if choice == 'q' or choice == 'quit':
                 break
-            elif choice == '1':
-                self._list_all_memories(console, memory_manager)
-            elif choice == '2':
-                self._list_global_memories(console, memory_manager)
-            elif choice == '3':
-                self._list_directory_memories(console, memory_manager)
-            elif choice == '4':
-                self._save_new_memory(console, prompt_session, memory_manager)
-            elif choice == '5':
-                self._remove_memory(console, prompt_session, memory_manager)
-            elif choice == '6':
-                self._clear_memories(console, prompt_session, memory_manager)
-            elif choice == '7':
-                self._import_memories(console, prompt_session, memory_manager)
-            elif choice == '8':
-                self._export_memories(console, memory_manager)
-            elif choice == '9':
-                self._show_statistics(console, memory_manager)
-            else:
+
+            action = actions.get(choice)
+            if action is None:
                 console.print("[red]Invalid choice. Please try again.[/red]")
+                continue
+
+            run, changes_memories = action
+            run()
+            if changes_memories:
+                memories_cache.clear()
 
         return CommandResult.ok()
 
-    def _list_all_memories(self, console, memory_manager) -> None:
+    def _list_all_memories(self, console, prompt_session, memory_manager, cached) -> None:
         """List all memories (global + directory)."""
-        memories = memory_manager.get_all_memories()
+        self._list_memories(console, prompt_session, cached(memory_manager.get_all_memories),
+                            "All Memories", "No memories found.", include_scope=True)
 
-        if not memories:
-            console.print("[yellow]No memories found.[/yellow]")
-            return
-
-        table = Table(title="All Memories", show_header=True, header_style="bold bright_blue")
-        table.add_column("ID", style="cyan")
-        table.add_column("Type", style="green")
-        table.add_column("Scope", style="yellow")
-        table.add_column("Content", style="white")
-        table.add_column("Created", style="dim")
-
-        for memory in memories:
-            table.add_row(
-                memory.get("id", ""),
-                memory.get("type", "").replace("_", " ").title(),
-                memory.get("scope", "directory"),
-                memory.get("content", "")[:50] + "..." if len(memory.get("content", "")) > 50 else memory.get("content", ""),
-                memory.get("created", "")[:10] if memory.get("created") else ""
-            )
-
-        console.print(table)
-
-    def _list_global_memories(self, console, memory_manager) -> None:
+    def _list_global_memories(self, console, prompt_session, memory_manager, cached) -> None:
         """List global memories only."""
-        memories = memory_manager.get_global_memories()
+        self._list_memories(console, prompt_session, cached(memory_manager.get_global_memories),
+                            "Global Memories", "No global memories found.")
 
+    def _list_directory_memories(self, console, prompt_session, memory_manager, cached) -> None:
+        """List directory memories only."""
+        self._list_memories(console, prompt_session, cached(memory_manager.get_directory_memories),
+                            f"Directory Memories ({memory_manager.current_directory})",
+                            "No directory memories found.")
+
+    def _list_memories(self, console, prompt_session, memories, title, empty_message,
+                       include_scope=False) -> None:
+        """
+        Print memories as a table, a page at a time when they don't fit on one.
+
+        Only the rows of the page on screen are formatted and rendered. The
+        scope column, when included, takes space from the content column.
+        """
         if not memories:
-            console.print("[yellow]No global memories found.[/yellow]")
+            console.print(f"[yellow]{empty_message}[/yellow]")
             return
 
-        table = Table(title="Global Memories", show_header=True, header_style="bold bright_blue")
-        table.add_column("ID", style="cyan")
-        table.add_column("Type", style="green")
-        table.add_column("Content", style="white")
-        table.add_column("Created", style="dim")
-
-        for memory in memories:
-            table.add_row(
-                memory.get("id", ""),
-                memory.get("type", "").replace("_", " ").title(),
-                memory.get("content", "")[:60] + "..." if len(memory.get("content", "")) > 60 else memory.get("content", ""),
-                memory.get("created", "")[:10] if memory.get("created") else ""
-            )
-
-        console.print(table)
+        columns = _ALL_MEMORY_COLUMNS if include_scope else _MEMORY_COLUMNS
+        content_limit = 50 if include_scope else 60
+        page_count = -(-len(memories) // _MEMORY_PAGE_SIZE)
+        page = 0
 
-    def _list_directory_memories(self, console, memory_manager) -> None:
-        """List directory memories only."""
-        memories = memory_manager.get_directory_memories()
+        while True:
+            table = make_table(title, columns)
+            start = page * _MEMORY_PAGE_SIZE
+            for memory in memories[start:start + _MEMORY_PAGE_SIZE]:
+                table.add_row(*_memory_row(memory, content_limit, include_scope))
 
-        if not memories:
-            console.print("[yellow]No directory memories found.[/yellow]")
-            return
+            if page_count > 1:
+                table.caption = f"Page {page + 1} of {page_count}"
+            console.print(table)
 
-        table = Table(title=f"Directory Memories ({memory_manager.current_directory})",
-                     show_header=True, header_style="bold bright_blue")
-        table.add_column("ID", style="cyan")
-        table.add_column("Type", style="green")
-        table.add_column("Content", style="white")
-        table.add_column("Created", style="dim")
-
-        for memory in memories:
-            table.add_row(
-                memory.get("id", ""),
-                memory.get("type", "").replace("_", " ").title(),
-                memory.get("content", "")[:60] + "..." if len(memory.get("content", "")) > 60 else memory.get("content", ""),
-                memory.get("created", "")[:10] if memory.get("created") else ""
-            )
+            if page_count == 1:
+                return
 
-        console.print(table)
+            choice = prompt_session.prompt("[n]ext/[p]rev/[q]uit: ").strip().lower()
+            if choice.startswith('q'):
+                return
+            if choice.startswith('p'):
+                page = max(page - 1, 0)
+            elif page + 1 < page_count:
+                page += 1
+            else:
+                return
 
     def _save_new_memory(self, console, prompt_session, memory_manager) -> None:
         """Save a new memory."""
@@ -159,25 +206,14 @@ class MemoryCommand(BaseCommand):
             return
 
         # Get memory type
-        console.print("\nMemory types:")
-        console.print("1. user_preference - User's preferred tools/patterns")
-        console.print("2. architectural_decision - Project structure/tech choices")
-        console.print("3. important_fact - Critical project information")
-        console.print("4. project_context - Specific constraints/requirements")
+        console.print(_MEMORY_TYPE_MENU)
 
         type_choice = prompt_session.prompt("Choose type (1-4): ").strip()
-        type_map = {
-            "1": "user_preference",
-            "2": "architectural_decision",
-            "3": "important_fact",
-            "4": "project_context"
-        }
-
-        if type_choice not in type_map:
+        if type_choice not in _MEMORY_TYPES:
             console.print("[red]Invalid type choice.[/red]")
             return
 
-        memory_type = type_map[type_choice]
+        memory_type = _MEMORY_TYPES[type_choice]
 
         # Get scope
         scope_choice = prompt_session.prompt("Scope - (d)irectory or (g)lobal [d]: ").strip().lower()
@@ -187,17 +223,17 @@ class MemoryCommand(BaseCommand):
         try:
             memory_id = memory_manager.save_memory(content, memory_type, scope)
             scope_text = "globally" if scope == "global" else "for current directory"
-            console.print(f"[green]✓ Saved {memory_type.replace('_', ' ').title()} {scope_text}: {content}[/green]")
+            console.print(f"[green]✓ Saved {_MEMORY_TYPE_NAMES[memory_type]} {scope_text}: {content}[/green]")
             console.print(f"[dim]Memory ID: {memory_id}[/dim]")
         except Exception as e:
             console.print(f"[red]Failed to save memory: {str(e)}[/red]")
 
-    def _remove_memory(self, console, prompt_session, memory_manager) -> None:
+    def _remove_memory(self, console, prompt_session, memory_manager, cached) -> None:
         """Remove a memory."""
         console.print("\n[bold]Remove Memory[/bold]")
 
         # Show current memories for reference
-        memories = memory_manager.get_all_memories()
+        memories = cached(memory_manager.get_all_memories)
         if not memories:
             console.print("[yellow]No memories to remove.[/yellow]")
             return
@@ -224,7 +260,7 @@ class MemoryCommand(BaseCommand):
         else:
             console.print(f"[red]Memory not found: {memory_id}[/red]")
 
-    def _clear_memories(self, console, prompt_session, memory_manager) -> None:
+    def _clear_memories(self, console, prompt_session, memory_manager, cached) -> None:
         """Clear memories."""
         console.print("\n[bold]Clear Memories[/bold]")
         console.print("1. Clear directory memories")
@@ -234,7 +270,7 @@ class MemoryCommand(BaseCommand):
         choice = prompt_session.prompt("Choose option (1-3): ").strip()
 
         if choice == "1":
-            count = len(memory_manager.get_directory_memories())
+            count = len(cached(memory_manager.get_directory_memories))
             if count == 0:
                 console.print("[yellow]No directory memories to clear.[/yellow]")
                 return
@@ -245,7 +281,7 @@ class MemoryCommand(BaseCommand):
                 console.print(f"[green]✓ Cleared {cleared} directory memories[/green]")
 
         elif choice == "2":
-            count = len(memory_manager.get_global_memories())
+            count = len(cached(memory_manager.get_global_memories))
             if count == 0:
                 console.print("[yellow]No global memories to clear.[/yellow]")
                 return
@@ -256,7 +292,9 @@ class MemoryCommand(BaseCommand):
                 console.print(f"[green]✓ Cleared {cleared} global memories[/green]")
 
         elif choice == "3":
-            total_count = len(memory_manager.get_all_memories())
+            # Same lists as options 1 and 2, so a second visit reuses them
+            total_count = (len(cached(memory_manager.get_directory_memories))
+                           + len(cached(memory_manager.get_global_memories)))
             if total_count == 0:
                 console.print("[yellow]No memories to clear.[/yellow]")
                 return
@@ -272,9 +310,6 @@ class MemoryCommand(BaseCommand):
 
     def _import_memories(self, console, prompt_session, memory_manager) -> None:
         """Import memories from another directory."""
-        import json
-        from pathlib import Path
-
         console.print("\n[bold]Import Memories[/bold]")
 
         dir_path = prompt_session.prompt("Directory path to import from: ").strip()
@@ -293,9 +328,8 @@ class MemoryCommand(BaseCommand):
                 console.print(f"[red]No memory file found in: {source_dir}[/red]")
                 return
 
-            # Load memories from file
-            with open(memory_file, encoding='utf-8') as f:
-                data = json.load(f)
+            # Load memories from file; json.loads decodes the UTF-8 bytes itself
+            data = json.loads(memory_file.read_bytes())
 
             memories = data.get("memories", [])
             if not memories:
@@ -319,9 +353,6 @@ class MemoryCommand(BaseCommand):
 
     def _export_memories(self, console, memory_manager) -> None:
         """Export memories."""
-        import json
-        from datetime import datetime
-
         console.print("\n[bold]Export Memories[/bold]")
 
         try:
@@ -331,8 +362,11 @@ class MemoryCommand(BaseCommand):
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"grok_memories_export_{timestamp}.json"
 
+            # Encode first so the file gets one write instead of the many small
+            # writes json.dump makes
+            encoded = json.dumps(export_data, indent=2, ensure_ascii=False)
             with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+                f.write(encoded)
 
             total_memories = len(export_data.get("global_memories", [])) + \
                            sum(len(memories) for memories in export_data.get("directory_memories", {}).values())
@@ -342,15 +376,20 @@ class MemoryCommand(BaseCommand):
         except Exception as e:
             console.print(f"[red]Failed to export memories: {str(e)}[/red]")
 
-    def _show_statistics(self, console, memory_manager) -> None:
+    def _show_statistics(self, console, memory_manager, cached) -> None:
         """Show memory statistics."""
+        # Built once per menu session until the memories change
+        table, breakdown = cached(lambda: self._statistics_view(memory_manager), _STATISTICS_KEY)
 
-        stats = memory_manager.get_memory_statistics()
+        console.print(table)
+        if breakdown:
+            console.print(breakdown)
 
-        table = Table(title="Memory Statistics", show_header=True, header_style="bold bright_blue")
-        table.add_column("Metric", style="cyan")
-        table.add_column("Value", style="white")
+    def _statistics_view(self, memory_manager) -> tuple[Table, str]:
+        """Build the statistics table and the memory types breakdown."""
+        stats = memory_manager.get_memory_statistics()
 
+        table = make_table("Memory Statistics", _STATISTICS_COLUMNS)
         table.add_row("Global Memories", str(stats["global_memories"]))
         table.add_row("Current Directory Memories", str(stats["current_directory_memories"]))
         table.add_row("Total Directory Memories", str(stats["total_directory_memories"]))
@@ -358,11 +397,12 @@ class MemoryCommand(BaseCommand):
         table.add_row("Total Memories", str(stats["total_memories"]))
         table.add_row("Current Directory", str(stats["current_directory"]))
 
-        console.print(table)
-
-        # Show memory types breakdown
+        # Memory types breakdown
+        breakdown = ""
         if stats["memory_types"]:
-            console.print("\n[bold]Memory Types:[/bold]")
-            for memory_type, count in stats["memory_types"].items():
-                type_name = memory_type.replace("_", " ").title()
-                console.print(f"  {type_name}: {count}")
+            breakdown = "\n".join(
+                ["\n[bold]Memory Types:[/bold]"]
+                + [f"  {_memory_type_name(memory_type)}: {count}"
+                   for memory_type, count in stats["memory_types"].items()]
+            )
+        return table, breakdown
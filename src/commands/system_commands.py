@@ -6,110 +6,34 @@ System commands for Grok Assistant
 Commands that handle system-level operations like exit, clear, help, etc.
 """
 
+from functools import cached_property
+from pathlib import Path
 
-from ..core.session import GrokSession
-from .base import BaseCommand, CommandResult
-
-
-class ExitCommand(BaseCommand):
-    """Handle /exit and /quit commands."""
-
-    def get_pattern(self) -> str:
-        return "/exit"
-
-    def get_description(self) -> str:
-        return "Exit the application (/exit or /quit)"
-
-    def matches(self, user_input: str) -> bool:
-        return user_input.strip().lower() in ("/exit", "/quit")
+from rich.console import Group
+from rich.panel import Panel
+from rich.table import Table
+from rich.text import Text
 
-    def execute(self, user_input: str, session: GrokSession) -> CommandResult:
-        from ..ui.console import get_console
-        console = get_console()
-        console.print("[bold blue]👋 Goodbye![/bold blue]")
-        return CommandResult.exit("User requested exit")
-
-
-class ClearScreenCommand(BaseCommand):
-    """Handle /cls command to clear screen."""
-
-    def get_pattern(self) -> str:
-        return "/cls"
-
-    def get_description(self) -> str:
-        return "Clear the screen"
-
-    def matches(self, user_input: str) -> bool:
-        return user_input.strip().lower() == "/cls"
-
-    def execute(self, user_input: str, session: GrokSession) -> CommandResult:
-        from ..ui.console import get_console
-        console = get_console()
-        console.clear()
-        return CommandResult.ok()
-
-
-class ClearContextCommand(BaseCommand):
-    """Handle /clear command to clear conversation context."""
-
-    def get_pattern(self) -> str:
-        return "/clear"
-
-    def get_description(self) -> str:
-        return "Clear conversation history"
-
-    def matches(self, user_input: str) -> bool:
-        return user_input.strip().lower() == "/clear"
-
-    def execute(self, user_input: str, session: GrokSession) -> CommandResult:
-        from ..ui.console import get_console, get_prompt_session
-
-        console = get_console()
-        prompt_session = get_prompt_session()
-
-        conversation_history = session.get_conversation_history()
-
-        if len(conversation_history) <= 1:
-            console.print("[yellow]Context already empty (only system prompt).[/yellow]")
-            return CommandResult.ok()
-
-        file_contexts = sum(1 for msg in conversation_history if msg["role"] == "system" and "User added file" in msg["content"])
-        total_messages = len(conversation_history) - 1
-
-        console.print(f"[yellow]Current context: {total_messages} messages, {file_contexts} file contexts[/yellow]")
-
-        # Confirm with user
-        confirm = prompt_session.prompt("🔵 Are you sure you want to clear the context? (y/N): ", default="n").strip().lower()
-
-        if confirm in ["y", "yes"]:
-            session.clear_context(keep_system_prompt=True)
-            console.print("[bold green]✓[/bold green] Context cleared (system prompt retained)")
-            return CommandResult.ok()
-        else:
-            console.print("[yellow]Context clear cancelled.[/yellow]")
-            return CommandResult.ok()
-
-
-class HelpCommand(BaseCommand):
-    """Handle /help command to show available commands."""
-
-    def get_pattern(self) -> str:
-        return "/help"
-
-    def get_description(self) -> str:
-        return "Show available commands and usage information"
-
-    def matches(self, user_input: str) -> bool:
-        return user_input.strip().lower() == "/help"
-
-    def execute(self, user_input: str, session: GrokSession) -> CommandResult:
-        from rich.panel import Panel
-
-        from ..ui.console import get_console
-
-        console = get_console()
-
-        help_text = f"""
+from ..core.session import GrokSession
+from ..ui import console as ui_console
+from ..ui.formatters import make_table
+from .base import BaseCommand, CommandResult, has_command_prefix
+
+# Table column layouts as (header, style) or (header, style, width)
+_OS_COLUMNS = (("Property", "bright_cyan"), ("Value", "white"))
+_SHELL_COLUMNS = (("Shell", "bright_cyan"), ("Available", "white"))
+_JOBS_COLUMNS = (
+    ("ID", "cyan", 4),
+    ("Status", "white", 10),
+    ("Shell", "green", 10),
+    ("Runtime", "yellow", 10),
+    ("Command", "white"),
+)
+
+_JOBS_HINT = Text("Use AI commands to check job output or kill jobs", style="dim")
+
+# /help text; the fuzzy matching state is the only part that varies
+_HELP_TEMPLATE = """
 **Grok Assistant** - Your AI-powered development companion with advanced agentic reasoning
 
 **File & Context Commands:**
@@ -120,7 +44,7 @@ class HelpCommand(BaseCommand):
 • `/context-mode` - Show current context management mode and options
 • `/sequential` - Switch to cache-optimized context mode (preserves history longer)
 • `/smart` - Switch to smart truncation mode (summarizes at 70% usage)
-• `/clear` - Clear conversation history
+• `/clear [-y]` - Clear conversation history (-y skips confirmation)
 • `/log` - Show recent conversation history
 
 **Memory Management:**
@@ -142,7 +66,7 @@ class HelpCommand(BaseCommand):
 • `/max` - Toggle extended 2M context for grok-4-1 models (default: 128K)
 
 **System Commands:**
-• `/fuzzy` - Toggle fuzzy matching mode (currently: {'enabled' if self.config.fuzzy_enabled_by_default else 'disabled'})
+• `/fuzzy` - Toggle fuzzy matching mode (currently: {fuzzy_state})
 • `/agent` - Toggle agentic mode (removes safety confirmations)
 • `/self` - Toggle self-evolving mode (AI can create custom tools)
 • `/reload-tools` - Reload custom tools from ~/.grok/custom_tools/
@@ -188,35 +112,152 @@ Use run_bash_background or run_powershell_background for long-running tasks in t
 • Natural language works best - just describe what you need!
 """
 
-        console.print(Panel(help_text, title="🚀 Grok Assistant Help", border_style="bright_blue"))
+# /help panels by fuzzy matching state, built on first use
+_HELP_PANELS: dict[bool, Panel] = {}
+
+# System message added when /self turns self-evolving mode on
+_SELF_MODE_INSTRUCTIONS = (
+    "SELF-EVOLVING MODE ACTIVE: You can create new tools using create_tool(). "
+    "Tools must inherit from BaseTool and have get_name() and execute() methods. "
+    "Include a create_tool(config) factory function. "
+    "Safety: No subprocess, eval, exec, or file system access outside allowed paths."
+)
+
+
+class ExitCommand(BaseCommand):
+    """Handle /exit and /quit commands."""
+
+    __slots__ = ()
+
+    exact_patterns = ("/exit", "/quit")
+
+    def get_pattern(self) -> str:
+        return "/exit"
+
+    def get_description(self) -> str:
+        return "Exit the application (/exit or /quit)"
+
+    def execute(self, user_input: str, session: GrokSession) -> CommandResult:
+        console = ui_console.get_console()
+        console.print("[bold blue]👋 Goodbye![/bold blue]")
+        return CommandResult.exit("User requested exit")
+
+
+class ClearScreenCommand(BaseCommand):
+    """Handle /cls command to clear screen."""
+
+    __slots__ = ()
+
+    exact_patterns = ("/cls",)
+
+    def get_pattern(self) -> str:
+        return "/cls"
+
+    def get_description(self) -> str:
+        return "Clear the screen"
+
+    def execute(self, user_input: str, session: GrokSession) -> CommandResult:
+        console = ui_console.get_console()
+        console.clear()
         return CommandResult.ok()
 
 
-class OsCommand(BaseCommand):
-    """Handle /os command to show OS information."""
+class ClearContextCommand(BaseCommand):
+    """Handle /clear command to clear conversation context."""
+
+    __slots__ = ()
+
+    exact_patterns = (
+        "/clear", "/clear -y", "/clear --yes",
+        "/clear context", "/clear context -y", "/clear context --yes",
+    )
 
     def get_pattern(self) -> str:
-        return "/os"
+        return "/clear"
 
     def get_description(self) -> str:
-        return "Show OS and environment information"
+        return "Clear conversation history (add -y to skip confirmation)"
 
-    def matches(self, user_input: str) -> bool:
-        return user_input.strip().lower() == "/os"
+    def execute(self, user_input: str, session: GrokSession) -> CommandResult:
+        console = ui_console.get_console()
+
+        # "/clear -y", "/clear context --yes", ... skip the confirmation prompt
+        auto_yes = user_input.lower().split()[-1] in ("-y", "--yes")
+
+        message_count = session.message_count
+
+        if message_count <= 1:
+            console.print("[yellow]Context already empty (only system prompt).[/yellow]")
+            return CommandResult.ok()
+
+        if not auto_yes:
+            file_contexts = session.file_context_count
+            total_messages = message_count - 1
+
+            console.print(f"[yellow]Current context: {total_messages} messages, {file_contexts} file contexts[/yellow]")
+
+            # Confirm with user
+            prompt_session = ui_console.get_prompt_session()
+            confirm = prompt_session.prompt("🔵 Are you sure you want to clear the context? (y/N): ", default="n").strip().lower()
+
+            if confirm not in ["y", "yes"]:
+                console.print("[yellow]Context clear cancelled.[/yellow]")
+                return CommandResult.ok()
+
+        session.clear_context(keep_system_prompt=True)
+        console.print("[bold green]✓[/bold green] Context cleared (system prompt retained)")
+        return CommandResult.ok()
+
+
+class HelpCommand(BaseCommand):
+    """Handle /help command to show available commands."""
+
+    __slots__ = ()
+
+    exact_patterns = ("/help",)
+
+    def get_pattern(self) -> str:
+        return "/help"
+
+    def get_description(self) -> str:
+        return "Show available commands and usage information"
 
     def execute(self, user_input: str, session: GrokSession) -> CommandResult:
-        from rich.table import Table
+        console = ui_console.get_console()
+
+        fuzzy_enabled = self.config.fuzzy_enabled_by_default
+        panel = _HELP_PANELS.get(fuzzy_enabled)
+        if panel is None:
+            help_text = _HELP_TEMPLATE.format(fuzzy_state='enabled' if fuzzy_enabled else 'disabled')
+            panel = _HELP_PANELS[fuzzy_enabled] = Panel(help_text, title="🚀 Grok Assistant Help",
+                                                        border_style="bright_blue")
+        console.print(panel)
+        return CommandResult.ok()
+
+
+class OsCommand(BaseCommand):
+    """Handle /os command to show OS information."""
 
-        from ..ui.console import get_console
+    # No __slots__: _info_tables is a cached_property and needs __dict__
 
-        console = get_console()
+    exact_patterns = ("/os",)
+
+    # (base_dir, rendered group) from the last /os
+    _last_render: tuple[Path, Group] | None = None
+
+    def get_pattern(self) -> str:
+        return "/os"
+
+    def get_description(self) -> str:
+        return "Show OS and environment information"
+
+    @cached_property
+    def _info_tables(self) -> tuple[Table, Table]:
+        """OS and shell tables, built once; the OS info is fixed for the session."""
         os_info = self.config.os_info
 
         # Create OS information table
-        os_table = Table(title="🖥️ Operating System Information", show_header=True, header_style="bold bright_blue")
-        os_table.add_column("Property", style="bright_cyan")
-        os_table.add_column("Value", style="white")
-
+        os_table = make_table("🖥️ Operating System Information", _OS_COLUMNS)
         os_table.add_row("System", os_info['system'])
         os_table.add_row("Release", os_info['release'])
         os_table.add_row("Version", os_info['version'])
@@ -224,41 +265,44 @@ class OsCommand(BaseCommand):
         os_table.add_row("Processor", os_info['processor'])
         os_table.add_row("Python Version", os_info['python_version'])
 
-        console.print(os_table)
-
         # Create shell availability table
-        shell_table = Table(title="🐚 Shell Availability", show_header=True, header_style="bold bright_green")
-        shell_table.add_column("Shell", style="bright_cyan")
-        shell_table.add_column("Available", style="white")
-
+        shell_table = make_table("🐚 Shell Availability", _SHELL_COLUMNS, header_style="bold bright_green")
         for shell, available in os_info['shell_available'].items():
             status = "✅ Available" if available else "❌ Not Available"
             shell_table.add_row(shell, status)
 
-        console.print(shell_table)
+        return os_table, shell_table
 
-        # Show current working directory
-        console.print(f"\n📁 Current Working Directory: [bright_cyan]{self.config.base_dir}[/bright_cyan]")
+    def _render(self) -> Group:
+        """Both tables and the working directory; rebuilt only when base_dir changes."""
+        base_dir = self.config.base_dir
+        if self._last_render is None or self._last_render[0] != base_dir:
+            os_table, shell_table = self._info_tables
+            cwd = Text.assemble("\n📁 Current Working Directory: ", (str(base_dir), "bright_cyan"))
+            self._last_render = (base_dir, Group(os_table, shell_table, cwd))
+        return self._last_render[1]
 
+    def execute(self, user_input: str, session: GrokSession) -> CommandResult:
+        console = ui_console.get_console()
+        console.print(self._render())
         return CommandResult.ok()
 
 
 class FuzzyCommand(BaseCommand):
     """Handle /fuzzy command to toggle fuzzy matching."""
 
+    __slots__ = ()
+
+    exact_patterns = ("/fuzzy",)
+
     def get_pattern(self) -> str:
         return "/fuzzy"
 
     def get_description(self) -> str:
         return "Toggle fuzzy matching mode for file operations"
 
-    def matches(self, user_input: str) -> bool:
-        return user_input.strip().lower() == "/fuzzy"
-
     def execute(self, user_input: str, session: GrokSession) -> CommandResult:
-        from ..ui.console import get_console
-
-        console = get_console()
+        console = ui_console.get_console()
 
         if not self.config.fuzzy_available:
             console.print("[bold red]✗[/bold red] Fuzzy matching is not available. Install 'thefuzz' package.")
@@ -278,30 +322,33 @@ class FuzzyCommand(BaseCommand):
 class AgentCommand(BaseCommand):
     """Handle /agent command to toggle agentic mode."""
 
+    __slots__ = ()
+
+    exact_patterns = ("/agent",)
+
     def get_pattern(self) -> str:
         return "/agent"
 
     def get_description(self) -> str:
         return "Toggle agentic mode (removes safety confirmations)"
 
-    def matches(self, user_input: str) -> bool:
-        return user_input.strip().lower() == "/agent"
-
     def execute(self, user_input: str, session: GrokSession) -> CommandResult:
-        from ..ui.console import get_console
-
-        console = get_console()
+        console = ui_console.get_console()
 
         # Toggle agent mode
         self.config.agent_mode = not self.config.agent_mode
 
         if self.config.agent_mode:
-            console.print("[bold yellow]⚡ Agentic mode enabled[/bold yellow]")
-            console.print("[dim]Shell commands will execute without confirmations.[/dim]")
-            console.print("[yellow]⚠️  Warning: Use with caution - AI can now execute commands autonomously![/yellow]")
+            console.print(
+                "[bold yellow]⚡ Agentic mode enabled[/bold yellow]\n"
+                "[dim]Shell commands will execute without confirmations.[/dim]\n"
+                "[yellow]⚠️  Warning: Use with caution - AI can now execute commands autonomously![/yellow]"
+            )
         else:
-            console.print("[bold green]✓ Agentic mode disabled[/bold green]")
-            console.print("[dim]Shell commands will require confirmation.[/dim]")
+            console.print(
+                "[bold green]✓ Agentic mode disabled[/bold green]\n"
+                "[dim]Shell commands will require confirmation.[/dim]"
+            )
 
         return CommandResult.ok()
 
@@ -309,6 +356,8 @@ class AgentCommand(BaseCommand):
 class MaxStepsCommand(BaseCommand):
     """Handle /max-steps command to set maximum reasoning steps."""
 
+    __slots__ = ()
+
     def get_pattern(self) -> str:
         return "/max-steps"
 
@@ -316,30 +365,33 @@ class MaxStepsCommand(BaseCommand):
         return "Set maximum reasoning steps (tool call iterations)"
 
     def matches(self, user_input: str) -> bool:
-        return user_input.strip().lower().startswith("/max-steps")
+        return has_command_prefix(user_input, "/max-steps")
 
-    def execute(self, user_input: str, session: GrokSession) -> CommandResult:
-        from ..ui.console import get_console
+    def matches_normalized(self, normalized: str) -> bool:
+        return normalized.startswith("/max-steps")
 
-        console = get_console()
+    def execute(self, user_input: str, session: GrokSession) -> CommandResult:
+        console = ui_console.get_console()
 
         args = self.extract_arguments(user_input).strip()
 
         # Show current setting if no argument
         if not args:
             current = self.config.max_reasoning_steps
-            if current >= 999999:
-                console.print("[cyan]Current maximum reasoning steps: Unlimited[/cyan]")
-            else:
-                console.print(f"[cyan]Current maximum reasoning steps: {current}[/cyan]")
-            console.print("[dim]Usage: /max-steps <number> or /max-steps unlimited[/dim]")
+            current_str = "Unlimited" if current >= 999999 else current
+            console.print(
+                f"[cyan]Current maximum reasoning steps: {current_str}[/cyan]\n"
+                "[dim]Usage: /max-steps <number> or /max-steps unlimited[/dim]"
+            )
             return CommandResult.ok()
 
         # Set unlimited
         if args.lower() in ["unlimited", "infinite", "0"]:
             self.config.max_reasoning_steps = 999999
-            console.print("[bold green]✓ Maximum reasoning steps set to unlimited[/bold green]")
-            console.print("[yellow]⚠️  Warning: AI can now execute unlimited tool calls![/yellow]")
+            console.print(
+                "[bold green]✓ Maximum reasoning steps set to unlimited[/bold green]\n"
+                "[yellow]⚠️  Warning: AI can now execute unlimited tool calls![/yellow]"
+            )
             return CommandResult.ok()
 
         # Set specific number
@@ -361,28 +413,25 @@ class MaxStepsCommand(BaseCommand):
 class JobsCommand(BaseCommand):
     """Handle /jobs command to list background jobs."""
 
+    __slots__ = ()
+
+    exact_patterns = ("/jobs",)
+
     def get_pattern(self) -> str:
         return "/jobs"
 
     def get_description(self) -> str:
         return "List all background jobs"
 
-    def matches(self, user_input: str) -> bool:
-        return user_input.strip().lower() == "/jobs"
-
     def execute(self, user_input: str, session: GrokSession) -> CommandResult:
-        from rich.table import Table
+        console = ui_console.get_console()
 
-        from ..ui.console import get_console
-
-        console = get_console()
-
-        # Check if background manager exists
-        if not hasattr(self.config, '_background_manager'):
+        # The background manager is created on the first background command
+        manager = getattr(self.config, '_background_manager', None)
+        if manager is None:
             console.print("[yellow]No background jobs running[/yellow]")
             return CommandResult.ok()
 
-        manager = self.config._background_manager
         jobs = manager.list_jobs()
 
         if not jobs:
@@ -390,30 +439,19 @@ class JobsCommand(BaseCommand):
             return CommandResult.ok()
 
         # Create table
-        table = Table(title="🔧 Background Jobs", show_header=True, header_style="bold bright_blue")
-        table.add_column("ID", style="cyan", width=4)
-        table.add_column("Status", style="white", width=10)
-        table.add_column("Shell", style="green", width=10)
-        table.add_column("Runtime", style="yellow", width=10)
-        table.add_column("Command", style="white")
+        table = make_table("🔧 Background Jobs", _JOBS_COLUMNS)
 
         for job in jobs:
-            is_running = job.is_running()
-            status_str = f"{'🟢' if is_running else '🔴'} {job.status}"
-            runtime_str = f"{job.get_runtime():.1f}s"
-            command_str = job.command[:60] + "..." if len(job.command) > 60 else job.command
-
+            command = job.command
             table.add_row(
                 str(job.job_id),
-                status_str,
+                f"{'🟢' if job.is_running() else '🔴'} {job.status}",
                 job.shell_type,
-                runtime_str,
-                command_str
+                f"{job.get_runtime():.1f}s",
+                command if len(command) <= 60 else f"{command[:60]}..."
             )
 
-        console.print(table)
-        console.print(f"\n[dim]Total jobs: {len(jobs)}[/dim]")
-        console.print("[dim]Use AI commands to check job output or kill jobs[/dim]")
+        console.print(Group(table, Text(f"\nTotal jobs: {len(jobs)}", style="dim"), _JOBS_HINT))
 
         return CommandResult.ok()
 
@@ -421,38 +459,37 @@ class JobsCommand(BaseCommand):
 class SelfModeCommand(BaseCommand):
     """Handle /self command to toggle self-evolving mode."""
 
+    __slots__ = ()
+
+    exact_patterns = ("/self",)
+
     def get_pattern(self) -> str:
         return "/self"
 
     def get_description(self) -> str:
         return "Toggle self-evolving mode (AI can create new tools)"
 
-    def matches(self, user_input: str) -> bool:
-        return user_input.strip().lower() == "/self"
-
     def execute(self, user_input: str, session: GrokSession) -> CommandResult:
-        from ..ui.console import get_console
-
-        console = get_console()
+        console = ui_console.get_console()
 
         # Toggle self-evolving mode
         self.config.self_mode = not getattr(self.config, 'self_mode', False)
 
         if self.config.self_mode:
-            console.print("[bold yellow]🔧 Self-evolving mode enabled[/bold yellow]")
-            console.print("[dim]AI can now create new tools. Tools are saved to ~/.grok/custom_tools/[/dim]")
-            console.print("[yellow]⚠️  Tools cannot modify the system prompt.[/yellow]")
-
-            # Add self-mode instructions to context
-            session.add_message("system",
-                "SELF-EVOLVING MODE ACTIVE: You can create new tools using create_tool(). "
-                "Tools must inherit from BaseTool and have get_name() and execute() methods. "
-                "Include a create_tool(config) factory function. "
-                "Safety: No subprocess, eval, exec, or file system access outside allowed paths."
+            console.print(
+                "[bold yellow]🔧 Self-evolving mode enabled[/bold yellow]\n"
+                "[dim]AI can now create new tools. Tools are saved to ~/.grok/custom_tools/[/dim]\n"
+                "[yellow]⚠️  Tools cannot modify the system prompt.[/yellow]"
             )
+
+            # Add self-mode instructions to context; the context manager drops
+            # the repeat when self mode is toggled on again
+            session.add_message("system", _SELF_MODE_INSTRUCTIONS)
         else:
-            console.print("[bold green]✓ Self-evolving mode disabled[/bold green]")
-            console.print("[dim]AI can no longer create new tools.[/dim]")
+            console.print(
+                "[bold green]✓ Self-evolving mode disabled[/bold green]\n"
+                "[dim]AI can no longer create new tools.[/dim]"
+            )
 
         return CommandResult.ok()
 
@@ -460,27 +497,27 @@ class SelfModeCommand(BaseCommand):
 class ReloadToolsCommand(BaseCommand):
     """Handle /reload-tools command to reload custom tools."""
 
+    __slots__ = ()
+
+    exact_patterns = ("/reload-tools",)
+
     def get_pattern(self) -> str:
         return "/reload-tools"
 
     def get_description(self) -> str:
         return "Reload custom tools from ~/.grok/custom_tools/"
 
-    def matches(self, user_input: str) -> bool:
-        return user_input.strip().lower() == "/reload-tools"
-
     def execute(self, user_input: str, session: GrokSession) -> CommandResult:
-        from ..ui.console import get_console
-
-        console = get_console()
+        console = ui_console.get_console()
 
         # Access tool registry through session/config
-        if not hasattr(self.config, '_tool_registry'):
+        tool_registry = getattr(self.config, '_tool_registry', None)
+        if tool_registry is None:
             console.print("[yellow]No tool registry available[/yellow]")
             return CommandResult.fail("Tool registry not initialized")
 
         try:
-            count = self.config._tool_registry.refresh_dynamic_tools(
+            count = tool_registry.refresh_dynamic_tools(
                 self.config._dynamic_loader
             )
             console.print(f"[bold green]✓ Reloaded {count} custom tool(s)[/bold green]")
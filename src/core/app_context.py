@@ -18,7 +18,7 @@ from src.ui import get_console, get_prompt_session
 from src.ui.adapter import MockUIAdapter, RichUIAdapter, UIProtocol
 
 
-@dataclass
+@dataclass(slots=True)
 class AppContext:
     """
     Composition root that manages all application dependencies.
@@ -6,13 +6,25 @@ Background process management for Grok Assistant
 Handles background shell commands and process tracking.
 """
 
+import codecs
+import io
+import shutil
 import subprocess
 import threading
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+# Most bytes read from a job's pipe at once
+_CAPTURE_CHUNK_SIZE = 64 * 1024
+
+# Lines kept per output stream; older lines are dropped so long-running,
+# chatty jobs use bounded memory
+_MAX_BUFFERED_LINES = 10000
+
 
 @dataclass
 class BackgroundJob:
@@ -23,14 +35,24 @@ class BackgroundJob:
     shell_type: str  # 'bash' or 'powershell'
     process: subprocess.Popen
     started_at: datetime
-    output_buffer: list[str] = field(default_factory=list)
-    error_buffer: list[str] = field(default_factory=list)
+    # Last _MAX_BUFFERED_LINES lines of each stream, appended to by the
+    # capture threads without the manager lock; deque.append is atomic
+    output_buffer: deque[str] = field(default_factory=lambda: deque(maxlen=_MAX_BUFFERED_LINES))
+    error_buffer: deque[str] = field(default_factory=lambda: deque(maxlen=_MAX_BUFFERED_LINES))
+    # Lines produced per stream, including those dropped from the buffers
+    output_total_lines: int = 0
+    error_total_lines: int = 0
     status: str = "running"  # running, completed, failed, killed
     exit_code: int | None = None
     cwd: Path | None = None
+    # Runtime and age are measured from here; started_at is for display
+    started_monotonic: float = field(default_factory=time.monotonic)
 
     def is_running(self) -> bool:
         """Check if the job is still running."""
+        if self.exit_code is not None:
+            # Already seen finishing; skip the poll
+            return False
         if self.process.poll() is None:
             return True
         else:
@@ -42,7 +64,7 @@ class BackgroundJob:
 
     def get_runtime(self) -> float:
         """Get runtime in seconds."""
-        return (datetime.now() - self.started_at).total_seconds()
+        return time.monotonic() - self.started_monotonic
 
     def kill(self) -> bool:
         """Kill the running process."""
@@ -50,7 +72,7 @@ class BackgroundJob:
             self.process.kill()
             self.status = "killed"
             return True
-        except:
+        except OSError:
             return False
 
 
@@ -67,6 +89,11 @@ class BackgroundProcessManager:
         self.jobs: dict[int, BackgroundJob] = {}
         self.next_job_id = 1
         self._lock = threading.Lock()
+        # Immutable copy of jobs.values(), rebound under the lock whenever
+        # jobs changes, so list_jobs() can read it without locking
+        self._jobs_snapshot: tuple[BackgroundJob, ...] = ()
+        # Resolved on the first PowerShell job
+        self._powershell_exe: str | None = None
 
     def start_job(
         self,
@@ -100,9 +127,11 @@ class BackgroundProcessManager:
                 bufsize=1
             )
         else:  # powershell
-            powershell_exe = 'pwsh' if subprocess.run(['which', 'pwsh'], capture_output=True).returncode == 0 else 'powershell'
+            if self._powershell_exe is None:
+                # Try PowerShell Core first (pwsh), then Windows PowerShell
+                self._powershell_exe = 'pwsh' if shutil.which('pwsh') else 'powershell'
             process = subprocess.Popen(
-                [powershell_exe, '-Command', command],
+                [self._powershell_exe, '-Command', command],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
@@ -123,28 +152,53 @@ class BackgroundProcessManager:
         # Start output capture threads
         threading.Thread(
             target=self._capture_output,
-            args=(job, process.stdout, job.output_buffer),
+            args=(job, process.stdout, job.output_buffer, "output_total_lines"),
             daemon=True
         ).start()
 
         threading.Thread(
             target=self._capture_output,
-            args=(job, process.stderr, job.error_buffer),
+            args=(job, process.stderr, job.error_buffer, "error_total_lines"),
             daemon=True
         ).start()
 
         with self._lock:
             self.jobs[job_id] = job
+            self._jobs_snapshot = tuple(self.jobs.values())
 
         return job_id
 
-    def _capture_output(self, job: BackgroundJob, stream, buffer: list[str]):
-        """Capture output from a stream to a buffer."""
+    def _capture_output(self, job: BackgroundJob, stream, buffer: deque[str], total_attr: str):
+        """
+        Capture output from a stream to a buffer, counting lines in the
+        job attribute named total_attr.
+
+        Reads whatever the pipe has ready (up to 64 KiB) from the binary
+        buffer under the text stream and splits it into lines, so chatty
+        jobs add many lines per read while slow ones still show up live.
+        Decoding and newline translation match the text stream's.
+        """
+        decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(stream.encoding)(stream.errors), translate=True
+        )
+        read = stream.buffer.read1
+        extend = buffer.extend
+        pending = ""
+        total = 0
         try:
-            for line in stream:
-                with self._lock:
-                    buffer.append(line.rstrip())
-        except:
+            while chunk := read(_CAPTURE_CHUNK_SIZE):
+                lines = (pending + decoder.decode(chunk)).split("\n")
+                pending = lines.pop()
+                extend([line.rstrip() for line in lines])
+                total += len(lines)
+                setattr(job, total_attr, total)
+
+            pending += decoder.decode(b"", final=True)
+            if pending:
+                buffer.append(pending.rstrip())
+                setattr(job, total_attr, total + 1)
+        except (OSError, ValueError):
+            # Pipe closed under us, or undecodable output (UnicodeDecodeError)
             pass
 
     def get_job(self, job_id: int) -> BackgroundJob | None:
@@ -152,10 +206,9 @@ class BackgroundProcessManager:
         with self._lock:
             return self.jobs.get(job_id)
 
-    def list_jobs(self) -> list[BackgroundJob]:
-        """List all jobs."""
-        with self._lock:
-            return list(self.jobs.values())
+    def list_jobs(self) -> tuple[BackgroundJob, ...]:
+        """List all jobs, in start order."""
+        return self._jobs_snapshot
 
     def kill_job(self, job_id: int) -> bool:
         """Kill a running job."""
@@ -191,12 +244,12 @@ class BackgroundProcessManager:
                 "exit_code": job.exit_code,
                 "runtime_seconds": job.get_runtime(),
                 "stdout": "\n".join(job.output_buffer),
-                "stdout_lines": len(job.output_buffer)
+                "stdout_lines": job.output_total_lines
             }
 
             if include_errors:
                 output["stderr"] = "\n".join(job.error_buffer)
-                output["stderr_lines"] = len(job.error_buffer)
+                output["stderr_lines"] = job.error_total_lines
 
         return output
 
@@ -207,16 +260,19 @@ class BackgroundProcessManager:
         Args:
             max_age_seconds: Maximum age to keep finished jobs
         """
-        with self._lock:
-            to_remove = []
-            for job_id, job in self.jobs.items():
-                if not job.is_running():
-                    age = (datetime.now() - job.started_at).total_seconds()
-                    if age > max_age_seconds:
-                        to_remove.append(job_id)
-
-            for job_id in to_remove:
-                del self.jobs[job_id]
+        # Poll outside the lock so capture threads and lookups aren't held up
+        jobs = self.list_jobs()
+        now = time.monotonic()
+        to_remove = [
+            job.job_id for job in jobs
+            if not job.is_running() and now - job.started_monotonic > max_age_seconds
+        ]
+
+        if to_remove:
+            with self._lock:
+                for job_id in to_remove:
+                    self.jobs.pop(job_id, None)
+                self._jobs_snapshot = tuple(self.jobs.values())
 
     def kill_all_jobs(self):
         """Kill all running jobs."""
@@ -8,13 +8,89 @@ and provides dependency injection for configuration values.
 """
 
 import json
+import os
 import platform
+import re
+import shutil
 from dataclasses import dataclass, field
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any
 
 from xai_sdk.chat import tool  # Used by get_tools() for dynamic tool schemas
 
+# Placeholders str.format() can't fill in the system prompt template: the
+# os_info['...'] lookups and the shell availability expression
+_SHELL_EXPRESSION = "{', '.join([shell for shell, available in os_info['shell_available'].items() if available]) or 'None'}"
+_PROMPT_PLACEHOLDER_RE = re.compile(
+    r"\{os_info\['(system|release|machine|python_version)'\]\}|" + re.escape(_SHELL_EXPRESSION)
+)
+
+
+@lru_cache(maxsize=1)
+def _read_prompt_file(path: Path, mtime_ns: int) -> str:
+    """Contents of the system prompt file; mtime_ns in the key rereads it after edits."""
+    with open(path, encoding='utf-8') as f:
+        return f.read().strip()
+
+
+@cache
+def _platform_info() -> dict[str, str]:
+    """
+    Platform details, fixed for the life of the process.
+
+    Probed once so later Config instances don't call into platform again
+    (platform.processor() may run a subprocess).
+    """
+    return {
+        'system': platform.system(),
+        'release': platform.release(),
+        'version': platform.version(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'python_version': platform.python_version(),
+    }
+
+
+@cache
+def _which_cached(name: str, path: str, pathext: str) -> str | None:
+    """shutil.which() for one PATH/PATHEXT; see _which()."""
+    return shutil.which(name, path=path)
+
+
+def _which(name: str) -> str | None:
+    """
+    Locate an executable, reusing earlier lookups.
+
+    Keyed by PATH and PATHEXT, so a changed environment gets a fresh lookup.
+    """
+    return _which_cached(name, os.environ.get('PATH', os.defpath), os.environ.get('PATHEXT', ''))
+
+
+# Default exclusions; each Config gets its own mutable copy
+_DEFAULT_EXCLUDED_FILES = frozenset({
+    ".DS_Store", "Thumbs.db", ".gitignore", ".python-version", "uv.lock",
+    ".uv", "uvenv", ".uvenv", ".venv", "venv", "__pycache__", ".pytest_cache",
+    ".coverage", ".mypy_cache", "node_modules", "package-lock.json", "yarn.lock",
+    "pnpm-lock.yaml", ".next", ".nuxt", "dist", "build", ".cache", ".parcel-cache",
+    ".turbo", ".vercel", ".output", ".contentlayer", "out", "coverage",
+    ".nyc_output", "storybook-static", ".env", ".env.local", ".env.development",
+    ".env.production", ".git", ".svn", ".hg", "CVS"
+})
+_DEFAULT_EXCLUDED_EXTENSIONS = frozenset({
+    ".png", ".jpg", ".jpeg", ".gif", ".ico", ".svg", ".webp", ".avif",
+    ".mp4", ".webm", ".mov", ".mp3", ".wav", ".ogg", ".zip", ".tar",
+    ".gz", ".7z", ".rar", ".exe", ".dll", ".so", ".dylib", ".bin",
+    ".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx", ".pyc",
+    ".pyo", ".pyd", ".egg", ".whl", ".uv", ".uvenv", ".db", ".sqlite",
+    ".sqlite3", ".log", ".idea", ".vscode", ".map", ".chunk.js",
+    ".chunk.css", ".min.js", ".min.css", ".bundle.js", ".bundle.css",
+    ".cache", ".tmp", ".temp", ".ttf", ".otf", ".woff", ".woff2", ".eot"
+})
+
+# Models whose 2M-token window is only used with extended context enabled
+_EXTENDED_CONTEXT_MODELS = frozenset({"grok-4-1-fast-reasoning", "grok-4-1-fast-non-reasoning"})
+
 
 @dataclass
 class Config:
@@ -114,6 +190,9 @@ class Config:
         "grok-code-fast-1": 128000,
     })
 
+    # (inputs, formatted prompt) from the last get_system_prompt()
+    _system_prompt_cache: tuple[tuple, str] | None = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Initialize configuration after object creation."""
         self._detect_os_info()
@@ -123,16 +202,13 @@ class Config:
 
     def _detect_os_info(self) -> None:
         """Detect OS information and available shells."""
+        platform_info = _platform_info()
+        system = platform_info['system']
         self.os_info = {
-            'system': platform.system(),
-            'release': platform.release(),
-            'version': platform.version(),
-            'machine': platform.machine(),
-            'processor': platform.processor(),
-            'python_version': platform.python_version(),
-            'is_windows': platform.system() == "Windows",
-            'is_mac': platform.system() == "Darwin",
-            'is_linux': platform.system() == "Linux",
+            **platform_info,
+            'is_windows': system == "Windows",
+            'is_mac': system == "Darwin",
+            'is_linux': system == "Linux",
             'shell_available': {
                 'bash': False,
                 'powershell': False,
@@ -146,8 +222,6 @@ class Config:
 
     def _detect_available_shells(self) -> None:
         """Detect which shells are available on the system."""
-        import shutil
-
         shells = ['bash', 'zsh', 'powershell', 'cmd']
         for shell in shells:
             if shell == 'cmd' and self.os_info['is_windows']:
@@ -156,11 +230,11 @@ class Config:
             elif shell == 'powershell':
                 # Check for both Windows PowerShell and PowerShell Core
                 self.os_info['shell_available'][shell] = (
-                    shutil.which('powershell') is not None or
-                    shutil.which('pwsh') is not None
+                    _which('powershell') is not None or
+                    _which('pwsh') is not None
                 )
             else:
-                self.os_info['shell_available'][shell] = shutil.which(shell) is not None
+                self.os_info['shell_available'][shell] = _which(shell) is not None
 
     def _load_config_file(self) -> None:
         """Load configuration from config.json file."""
@@ -235,30 +309,15 @@ class Config:
     def _set_default_exclusions(self) -> None:
         """Set default file and extension exclusions."""
         if not self.excluded_files:
-            self.excluded_files = {
-                ".DS_Store", "Thumbs.db", ".gitignore", ".python-version", "uv.lock",
-                ".uv", "uvenv", ".uvenv", ".venv", "venv", "__pycache__", ".pytest_cache",
-                ".coverage", ".mypy_cache", "node_modules", "package-lock.json", "yarn.lock",
-                "pnpm-lock.yaml", ".next", ".nuxt", "dist", "build", ".cache", ".parcel-cache",
-                ".turbo", ".vercel", ".output", ".contentlayer", "out", "coverage",
-                ".nyc_output", "storybook-static", ".env", ".env.local", ".env.development",
-                ".env.production", ".git", ".svn", ".hg", "CVS"
-            }
+            self.excluded_files = set(_DEFAULT_EXCLUDED_FILES)
 
         if not self.excluded_extensions:
-            self.excluded_extensions = {
-                ".png", ".jpg", ".jpeg", ".gif", ".ico", ".svg", ".webp", ".avif",
-                ".mp4", ".webm", ".mov", ".mp3", ".wav", ".ogg", ".zip", ".tar",
-                ".gz", ".7z", ".rar", ".exe", ".dll", ".so", ".dylib", ".bin",
-                ".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx", ".pyc",
-                ".pyo", ".pyd", ".egg", ".whl", ".uv", ".uvenv", ".db", ".sqlite",
-                ".sqlite3", ".log", ".idea", ".vscode", ".map", ".chunk.js",
-                ".chunk.css", ".min.js", ".min.css", ".bundle.js", ".bundle.css",
-                ".cache", ".tmp", ".temp", ".ttf", ".otf", ".woff", ".woff2", ".eot"
-            }
+            self.excluded_extensions = set(_DEFAULT_EXCLUDED_EXTENSIONS)
 
     def _validate_fuzzy_availability(self) -> None:
         """Check if fuzzy matching is available."""
+        # thefuzz requires rapidfuzz, which fuzzy path lookup calls directly, so
+        # checking for thefuzz covers both and the install tips name only thefuzz
         try:
             from thefuzz import fuzz
             from thefuzz import process as fuzzy_process
@@ -276,7 +335,7 @@ class Config:
         base_limit = self.MODEL_CONTEXT_LIMITS.get(model_name, 128000)
 
         # If extended context is disabled and this is a grok-4-1 model, limit to 128K
-        if not self.use_extended_context and model_name in ["grok-4-1-fast-reasoning", "grok-4-1-fast-non-reasoning"]:
+        if not self.use_extended_context and model_name in _EXTENDED_CONTEXT_MODELS:
             return 128000
 
         return base_limit
@@ -340,18 +399,22 @@ class Config:
         return self._load_and_format_system_prompt()
 
     def _load_system_prompt(self) -> str:
-        """Load system prompt from external file."""
+        """Load system prompt from external file, rereading it only when it changes."""
         try:
             prompt_path = Path(__file__).parent.parent.parent / "system_prompt.txt"
-            if prompt_path.exists():
-                with open(prompt_path, encoding='utf-8') as f:
-                    return f.read().strip()
-        except (OSError, FileNotFoundError):
+            return _read_prompt_file(prompt_path, prompt_path.stat().st_mtime_ns)
+        except OSError:
             pass
         return self._get_default_system_prompt()
 
     def _load_and_format_system_prompt(self) -> str:
-        """Load and format the system prompt with current environment info."""
+        """
+        Load and format the system prompt with current environment info.
+
+        The result is reused while the template, working directory, shells
+        and git status are unchanged; the platform details in os_info are
+        fixed for the process.
+        """
         prompt_template = self._load_system_prompt()
 
         # Build shell availability string
@@ -364,6 +427,14 @@ class Config:
             branch = self.git_branch or 'unknown'
             git_status = f'Enabled (branch: {branch})'
 
+        cache_key = (prompt_template, str(self.base_dir), shells_str, git_status)
+        if self._system_prompt_cache is not None and self._system_prompt_cache[0] == cache_key:
+            return self._system_prompt_cache[1]
+        self._system_prompt_cache = (cache_key, self._format_system_prompt(prompt_template, shells_str, git_status))
+        return self._system_prompt_cache[1]
+
+    def _format_system_prompt(self, prompt_template: str, shells_str: str, git_status: str) -> str:
+        """Fill the environment details into the system prompt template."""
         # Build context dictionary for template formatting
         # Handle nested dictionary access by flattening the values
         format_context = {
@@ -384,28 +455,13 @@ class Config:
             formatted_prompt = prompt_template.format(**format_context)
             return formatted_prompt
         except (KeyError, ValueError):
-            # If template formatting fails, manually replace the known problematic patterns
-            formatted_prompt = prompt_template
-
-            # Replace os_info dictionary access patterns
-            formatted_prompt = formatted_prompt.replace(
-                "{os_info['system']}", self.os_info.get('system', 'Unknown')
-            )
-            formatted_prompt = formatted_prompt.replace(
-                "{os_info['release']}", self.os_info.get('release', 'Unknown')
-            )
-            formatted_prompt = formatted_prompt.replace(
-                "{os_info['machine']}", self.os_info.get('machine', 'Unknown')
-            )
-            formatted_prompt = formatted_prompt.replace(
-                "{os_info['python_version']}", self.os_info.get('python_version', 'Unknown')
-            )
-
-            # Replace the complex shell availability expression
-            shell_expression = "{', '.join([shell for shell, available in os_info['shell_available'].items() if available]) or 'None'}"
-            formatted_prompt = formatted_prompt.replace(shell_expression, shells_str)
+            # If template formatting fails, replace the known problematic
+            # patterns in a single pass
+            def replace(match: re.Match) -> str:
+                key = match.group(1)
+                return self.os_info.get(key, 'Unknown') if key else shells_str
 
-            return formatted_prompt
+            return _PROMPT_PLACEHOLDER_RE.sub(replace, prompt_template)
 
     def _get_default_system_prompt(self) -> str:
         """Get the default system prompt."""
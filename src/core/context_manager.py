@@ -79,6 +79,13 @@ class ContextManager:
         self._files_in_context: set[str] = set()  # Normalized paths of files already in context
         self._system_message_hashes: set[str] = set()  # Track system message content hashes
 
+        # Monotonic counter bumped on every state mutation; lets callers cache derived views
+        self._version = 0
+
+        # Layer 2 messages and their token count, rebuilt lazily after mounts change
+        self._mounts_version = 0
+        self._mounted_context_cache: tuple[tuple, list[dict[str, Any]], int] | None = None
+
     @property
     def full_context(self) -> list[dict[str, Any]]:
         """
@@ -106,6 +113,23 @@ class ContextManager:
 
         return valid_messages
 
+    @property
+    def version(self) -> int:
+        """
+        Version tag of the context state.
+        Changes whenever messages, turns, mounted files, memories or mode change.
+        """
+        return self._version
+
+    def _bump_version(self) -> None:
+        """Mark the context state as changed."""
+        self._version += 1
+
+    def _mounts_changed(self) -> None:
+        """Mark the mounted files as changed; Layer 2 is rebuilt on next use."""
+        self._mounts_version += 1
+        self._bump_version()
+
     @property
     def cache_token_threshold(self) -> int:
         """
@@ -131,6 +155,7 @@ class ContextManager:
         """
         old_mode = self.mode
         self.mode = mode
+        self._bump_version()
 
         # If switching from cache to smart mode, apply immediate truncation
         if old_mode == ContextMode.CACHE_OPTIMIZED and mode == ContextMode.SMART_TRUNCATION:
@@ -148,6 +173,7 @@ class ContextManager:
             memories: List of memory objects to inject into context
         """
         self.memories = memories
+        self._bump_version()
 
     def set_task_summary(self, task_summary: str) -> None:
         """
@@ -156,7 +182,9 @@ class ContextManager:
         Args:
             task_summary: Task summary string from TaskManager
         """
-        self.task_summary = task_summary
+        if task_summary != self.task_summary:
+            self.task_summary = task_summary
+            self._bump_version()
 
     def mount_file(self, path: str, content: str) -> None:
         """
@@ -180,6 +208,7 @@ class ContextManager:
 
         self.mounted_files[normalized_path] = file_context
         self.add_file_to_context(normalized_path)
+        self._mounts_changed()
 
     def unmount_file(self, path: str) -> bool:
         """
@@ -194,9 +223,9 @@ class ContextManager:
         # Normalize the path to absolute form
         normalized_path = str(Path(path).resolve())
 
-        # Remove from mounted files if present
-        if normalized_path in self.mounted_files:
-            del self.mounted_files[normalized_path]
+        # Remove from mounted files if present (single hash lookup)
+        if self.mounted_files.pop(normalized_path, None) is not None:
+            self._mounts_changed()
             return True
 
         return False
@@ -238,6 +267,7 @@ class ContextManager:
                     token_count=token_count,
                     timestamp=time.time()
                 )
+                self._mounts_changed()
                 return True
             except Exception as e:
                 # If we can't read the file, it might have been deleted
@@ -245,6 +275,7 @@ class ContextManager:
                 print(f"Warning: Failed to refresh mounted file {path}: {e}")
                 print("  Unmounting file from context.")
                 del self.mounted_files[normalized_path]
+                self._mounts_changed()
                 return False
 
         return False
@@ -300,6 +331,7 @@ class ContextManager:
         self._system_message_hashes.add(content_hash)
         message = {"role": "system", "content": content}
         self._system_messages.append(message)
+        self._bump_version()
         return True
 
     def start_turn(self, user_message: str) -> str:
@@ -318,6 +350,7 @@ class ContextManager:
 
         # Start turn logging (turn becomes part of full_context automatically via property)
         turn_id = self.turn_logger.start_turn(user_message)
+        self._bump_version()
 
         return turn_id
 
@@ -333,6 +366,7 @@ class ContextManager:
         """
         # Log to turn logger (becomes part of full_context automatically via property)
         self.turn_logger.add_assistant_message(content)
+        self._bump_version()
 
     def add_tool_call(self, tool_name: str, args: dict[str, Any]) -> None:
         """
@@ -343,6 +377,7 @@ class ContextManager:
             args: Tool arguments
         """
         self.turn_logger.add_tool_call(tool_name, args)
+        self._bump_version()
 
     def add_tool_response(self, tool_name: str, result: str) -> None:
         """
@@ -354,6 +389,7 @@ class ContextManager:
         """
         # Log to turn logger (becomes part of full_context automatically via property)
         self.turn_logger.add_tool_response(tool_name, result)
+        self._bump_version()
 
     def complete_turn(self, summary: str | None = None) -> Turn | None:
         """
@@ -370,6 +406,7 @@ class ContextManager:
 
         # Complete the turn
         completed_turn = self.turn_logger.complete_turn(summary)
+        self._bump_version()
 
         # Apply mode-specific context management
         if self.mode == ContextMode.SMART_TRUNCATION:
@@ -405,7 +442,7 @@ class ContextManager:
         )
 
         # LAYER 2: Inject mounted files as system messages (persistent layer)
-        mounted_files_messages = self._build_mounted_files_context()
+        mounted_files_messages, layer2_tokens = self._get_mounted_files_context()
 
         # LAYER 3: Get dialogue stream (current turn + turn logs)
         current_turn_messages = []
@@ -427,7 +464,6 @@ class ContextManager:
 
         # Calculate token usage for each layer
         layer1_tokens, _ = self.token_manager.estimate_context_tokens(base_context)
-        layer2_tokens, _ = self.token_manager.estimate_context_tokens(mounted_files_messages)
         layer3_tokens, _ = self.token_manager.estimate_context_tokens(dialogue_context)
 
         total_tokens = layer1_tokens + layer2_tokens + layer3_tokens
@@ -466,6 +502,24 @@ class ContextManager:
 
         return final_context
 
+    def _get_mounted_files_context(self) -> tuple[list[dict[str, Any]], int]:
+        """
+        Get the Layer 2 messages and their token count.
+
+        Both are cached until a file is mounted, unmounted or refreshed (or the
+        base directory changes), so unchanged mounts aren't re-tokenized on every
+        API call and several /remove commands cost a single rebuild.
+
+        Returns:
+            Tuple of (mounted file messages, estimated tokens)
+        """
+        key = (self._mounts_version, self.config.base_dir, self.config.use_relative_paths)
+        if self._mounted_context_cache is None or self._mounted_context_cache[0] != key:
+            messages = self._build_mounted_files_context()
+            tokens, _ = self.token_manager.estimate_context_tokens(messages)
+            self._mounted_context_cache = (key, messages, tokens)
+        return self._mounted_context_cache[1], self._mounted_context_cache[2]
+
     def _build_mounted_files_context(self) -> list[dict[str, Any]]:
         """
         Build context messages for mounted files (Layer 2).
@@ -579,6 +633,7 @@ class ContextManager:
         self.turn_logs = self.truncation_strategy.truncate_turns(
             self.turn_logs, target_tokens, self.token_manager.estimate_context_tokens
         )
+        self._bump_version()
 
     def _convert_full_context_to_turns(self) -> None:
         """
@@ -596,6 +651,7 @@ class ContextManager:
 
         # Append new turns to existing turn logs
         self.turn_logs.extend(new_turns)
+        self._bump_version()
 
     def get_context_stats(self) -> dict[str, Any]:
         """
@@ -670,12 +726,15 @@ class ContextManager:
 
         if not keep_mounted_files:
             self.mounted_files = {}
+            self._mounts_version += 1
             self.clear_file_tracking()
 
         # Reset turn logger
         if self.turn_logger.is_turn_active():
             self.turn_logger.complete_turn("Context cleared")
 
+        self._bump_version()
+
     def export_context(self, include_full_context: bool = False) -> dict[str, Any]:
         """
         Export context data for debugging or analysis.
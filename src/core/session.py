@@ -35,6 +35,9 @@ class GrokSession:
     state before each API call. This eliminates dual-tracking bugs.
     """
 
+    # Number of "User added file" system messages currently in context
+    file_context_count: int = 0
+
     def __init__(self, client: Client, config: Config, tool_executor=None):
         """
         Initialize a new Grok session.
@@ -57,6 +60,13 @@ class GrokSession:
         self.task_manager = TaskManager()
         self.context_manager = ContextManager(config)
 
+        # Cached get_context_info() / get_conversation_history() results as (version key, value)
+        self._ctx_info_cache: tuple[tuple, dict[str, Any]] | None = None
+        self._history_cache: tuple[tuple, list[dict[str, Any]]] | None = None
+
+        # Maintained incrementally so /clear doesn't need to scan the history
+        self.file_context_count = 0
+
         # Set memories in context manager (flat + episodic)
         memories = self.memory_manager.get_memories_for_context()
         episodes = self.episodic_memory.get_episodes_for_context(limit=3)
@@ -135,17 +145,17 @@ class GrokSession:
         if role == "user":
             self.start_turn(content)
         elif role == "assistant":
-            tool_calls = kwargs.get("tool_calls")
-            self.context_manager.add_assistant_message(content, tool_calls)
+            self.add_assistant_response(content, kwargs.get("tool_calls"))
         elif role == "tool":
-            tool_name = kwargs.get("tool_name", "unknown_tool")
-            self.context_manager.add_tool_response(tool_name, content)
+            self.add_tool_result(kwargs.get("tool_name", "unknown_tool"), content)
         elif role == "system":
-            self.context_manager.add_system_message(content)
+            added = self.context_manager.add_system_message(content)
+            if added and content.startswith("User added file"):
+                self.file_context_count += 1
 
     def switch_model(self, new_model: str) -> None:
         """
-        Switch to a different model.
+        Switch to a different model. No-op if the model is already active.
 
         Args:
             new_model: Model name to switch to
@@ -246,17 +256,56 @@ class GrokSession:
         """
         # Clear context manager
         self.context_manager.clear_context(keep_memories=True)
+        self.file_context_count = 0
 
         # Re-add initial context
         self._add_initial_context()
 
     def get_context_info(self) -> dict[str, Any]:
-        """Get current context usage information."""
-        return self.context_manager.get_context_stats()
+        """
+        Get current context usage information.
+
+        The stats are memoized against the context manager's version tag and the
+        active model limits, so repeated calls without new messages are O(1).
+        """
+        version = self._context_version()
+        if self._ctx_info_cache is not None and self._ctx_info_cache[0] == version:
+            return dict(self._ctx_info_cache[1])
+
+        info = self.context_manager.get_context_stats()
+        self._ctx_info_cache = (version, info)
+        return dict(info)
+
+    def _context_version(self) -> tuple:
+        """Cache key for state derived from the context manager."""
+        return (
+            self.context_manager.version,
+            self.config.current_model,
+            self.config.use_extended_context,
+            self.config.git_enabled,
+            self.config.git_branch,
+        )
 
     def get_conversation_history(self) -> list[dict[str, Any]]:
-        """Get a copy of the conversation history."""
-        return self.context_manager.get_context_for_api()
+        """
+        Get the conversation history as sent to the API.
+
+        The history is cached until the context changes; each call returns a
+        new list, so callers can't alter the cached copy.
+        """
+        return list(self._cached_history())
+
+    def _cached_history(self) -> list[dict[str, Any]]:
+        """Shared cached history, rebuilt when the context version changes."""
+        version = self._context_version()
+        if self._history_cache is None or self._history_cache[0] != version:
+            self._history_cache = (version, self.context_manager.get_context_for_api())
+        return self._history_cache[1]
+
+    @property
+    def message_count(self) -> int:
+        """Number of messages in the conversation history."""
+        return len(self._cached_history())
 
     def get_model_info(self) -> dict[str, Any]:
         """Get current model information."""
@@ -334,18 +383,22 @@ class GrokSession:
 
     def set_context_mode(self, mode: str) -> None:
         """
-        Set the context management mode.
+        Set the context management mode. No-op if the mode is already active.
 
         Args:
             mode: Context mode ('cache_optimized' or 'smart_truncation')
         """
         if mode == "cache_optimized":
-            self.context_manager.set_mode(ContextMode.CACHE_OPTIMIZED)
+            new_mode = ContextMode.CACHE_OPTIMIZED
         elif mode == "smart_truncation":
-            self.context_manager.set_mode(ContextMode.SMART_TRUNCATION)
+            new_mode = ContextMode.SMART_TRUNCATION
         else:
             raise ValueError(f"Invalid context mode: {mode}")
 
+        if new_mode == self.context_manager.get_mode():
+            return
+        self.context_manager.set_mode(new_mode)
+
     def get_context_mode(self) -> str:
         """Get the current context management mode."""
         return self.context_manager.get_mode().value
@@ -7,6 +7,8 @@ Extracts directory change logic from FolderCommand, providing a clean,
 testable service layer for directory operations.
 """
 
+import os
+import stat
 from pathlib import Path
 
 from ..core.config import Config
@@ -46,7 +48,7 @@ class DirectoryService:
                 return self.config.base_dir
             elif path_str.startswith("~"):
                 return Path(path_str).expanduser().resolve()
-            elif Path(path_str).is_absolute():
+            elif os.path.isabs(path_str):
                 return Path(path_str).resolve()
             else:
                 # Relative to current directory
@@ -65,16 +67,17 @@ class DirectoryService:
             Tuple of (is_valid, error_message)
         """
         try:
-            if not path.exists():
-                return False, f"Directory does not exist: {path}"
-
-            if not path.is_dir():
-                return False, f"Path is not a directory: {path}"
+            # One stat answers both questions
+            mode = path.stat().st_mode
+        except (FileNotFoundError, NotADirectoryError):
+            return False, f"Directory does not exist: {path}"
+        except OSError as e:
+            return False, f"Error accessing directory: {str(e)}"
 
-            return True, None
+        if not stat.S_ISDIR(mode):
+            return False, f"Path is not a directory: {path}"
 
-        except (FileNotFoundError, OSError, PermissionError) as e:
-            return False, f"Error accessing directory: {str(e)}"
+        return True, None
 
     def change_directory(
         self,
@@ -34,6 +34,7 @@ from .formatters import (
     format_success_message,
     format_tool_result,
     format_warning_message,
+    make_table,
 )
 
 __all__ = [
@@ -48,5 +49,6 @@ __all__ = [
     # Formatter functions
     'format_conversation_log', 'format_file_content', 'format_directory_tree',
     'format_context_stats', 'format_tool_result', 'format_error_message',
-    'format_success_message', 'format_info_message', 'format_warning_message'
+    'format_success_message', 'format_info_message', 'format_warning_message',
+    'make_table'
 ]
@@ -7,15 +7,54 @@ Handles formatting of various data types for console display.
 """
 
 import json
+from functools import cache
 from pathlib import Path
 from typing import Any
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.syntax import Syntax
-from rich.table import Table
+from rich.table import Column, Table
 from rich.text import Text
 
+ColumnSpec = tuple[str, str] | tuple[str, str, int | None]
+
+
+@cache
+def _column_templates(columns: tuple[ColumnSpec, ...]) -> tuple[Column, ...]:
+    """Build Column templates once per distinct column layout."""
+    templates = []
+    for index, (header, style, *width) in enumerate(columns):
+        templates.append(Column(
+            _index=index,
+            header=header,
+            style=style,
+            width=width[0] if width else None,
+            highlight=False,
+        ))
+    return tuple(templates)
+
+
+def make_table(title: str, columns: tuple[ColumnSpec, ...],
+               header_style: str = "bold bright_blue") -> Table:
+    """
+    Create a table with a header row from a column layout.
+
+    Column definitions are cached per layout and copied into each new table
+    (a Column holds its table's cells, so templates are never shared directly).
+
+    Args:
+        title: Table title
+        columns: Tuple of (header, style) or (header, style, width) specs
+        header_style: Style for the header row
+
+    Returns:
+        Empty table ready for add_row()
+    """
+    table = Table(title=title, show_header=True, header_style=header_style)
+    table.columns.extend(column.copy() for column in _column_templates(columns))
+    return table
+
 
 def format_conversation_log(messages: list[dict[str, Any]], console: Console) -> None:
     """
@@ -167,9 +206,7 @@ def format_context_stats(context_info: dict[str, Any], console: Console) -> None
         context_info: Context information
         console: Rich console instance
     """
-    table = Table(title="📊 Context Statistics", show_header=True, header_style="bold bright_blue")
-    table.add_column("Metric", style="bright_cyan")
-    table.add_column("Value", style="white")
+    table = make_table("📊 Context Statistics", (("Metric", "bright_cyan"), ("Value", "white")))
 
     table.add_row("Model", context_info.get('model', 'Unknown'))
     table.add_row("Messages", str(context_info.get('messages', 0)))
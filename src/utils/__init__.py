@@ -11,6 +11,7 @@ from .file_utils import (
     detect_file_encoding,
     enhanced_binary_detection,
     find_best_matching_file,
+    invalidate_fuzzy_candidates,
     is_binary_file,
     safe_file_read,
 )
@@ -51,7 +52,7 @@ __all__ = [
     # File utilities
     'is_binary_file', 'detect_file_encoding', 'enhanced_binary_detection',
     'safe_file_read', 'find_best_matching_file', 'apply_fuzzy_diff_edit',
-    'add_file_context_smartly',
+    'add_file_context_smartly', 'invalidate_fuzzy_candidates',
 
     # Text utilities
     'estimate_token_usage', 'get_context_usage_info', 'smart_truncate_history',
@@ -7,6 +7,7 @@ Handles file reading, writing, encoding detection, and fuzzy matching.
 """
 
 import mimetypes
+import mmap
 import os
 from pathlib import Path
 from typing import Any
@@ -14,6 +15,15 @@ from typing import Any
 from ..core.config import Config
 from .path_utils import normalize_path
 
+# Files at least this large are decoded straight from a memory map
+_MMAP_READ_THRESHOLD = 64 * 1024
+
+# Fuzzy match candidates per root directory, as (directory mtimes, exclusions,
+# {relative path: normalized path}, {lowercase basename: [relative paths]})
+_CANDIDATES_CACHE: dict[
+    Path, tuple[dict[str, int], tuple[frozenset, frozenset], dict[str, str], dict[str, list[str]]]
+] = {}
+
 
 def is_binary_file(file_path: str, peek_size: int = 8192) -> bool:
     """
@@ -166,6 +176,23 @@ def enhanced_binary_detection(file_path: str, peek_size: int = 8192) -> dict[str
         return result
 
 
+def _read_text_mapped(file_path: str, encoding: str) -> str:
+    """
+    Read a text file by decoding a memory map of it.
+
+    Gives the same result as open(file_path, encoding=encoding,
+    errors='replace').read(), but decodes from the mapped pages instead of
+    first copying the whole file into a bytes object.
+    """
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        content = str(mapped, encoding, 'replace')
+
+    # Universal newlines, as in text mode
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
 def safe_file_read(file_path: str, max_size: int | None = None, config: Config = None) -> dict[str, Any]:
     """
     Safely read a file with comprehensive error handling and size limits.
@@ -245,8 +272,11 @@ def safe_file_read(file_path: str, max_size: int | None = None, config: Config =
             result['warnings'].append(f"Low confidence encoding detection: {encoding} ({confidence:.1%})")
 
         # Read file content
-        with open(normalized_path, encoding=encoding, errors='replace') as f:
-            content = f.read()
+        if file_size >= _MMAP_READ_THRESHOLD:
+            content = _read_text_mapped(normalized_path, encoding)
+        else:
+            with open(normalized_path, encoding=encoding, errors='replace') as f:
+                content = f.read()
 
         result['success'] = True
         result['content'] = content
@@ -271,6 +301,95 @@ def safe_file_read(file_path: str, max_size: int | None = None, config: Config =
         return result
 
 
+def invalidate_fuzzy_candidates(root_dir: Path | None = None) -> None:
+    """
+    Forget cached fuzzy match candidates.
+
+    Args:
+        root_dir: Root directory to forget, or None to clear every directory
+    """
+    if root_dir is None:
+        _CANDIDATES_CACHE.clear()
+    else:
+        _CANDIDATES_CACHE.pop(Path(root_dir), None)
+
+
+def _get_fuzzy_candidates(
+    root_dir: Path, config: Config, processor
+) -> tuple[dict[str, str], dict[str, list[str]]]:
+    """
+    Get the files under root_dir that fuzzy matching may pick.
+
+    The walk is cached per root directory. Adding, removing or renaming an
+    entry changes its parent directory's mtime, so the cache is reused while
+    every walked directory still has the mtime recorded for it.
+
+    Args:
+        root_dir: Root directory to search
+        config: Configuration object (for exclusions)
+        processor: Normalization applied to each relative path
+
+    Returns:
+        Tuple of (relative path -> normalized path, lowercase basename -> relative paths)
+    """
+    root_dir = Path(root_dir)
+    exclusions = (frozenset(config.excluded_files), frozenset(config.excluded_extensions))
+
+    cached = _CANDIDATES_CACHE.get(root_dir)
+    if cached is not None and cached[1] == exclusions:
+        try:
+            if all(os.stat(d).st_mtime_ns == mtime for d, mtime in cached[0].items()):
+                return cached[2], cached[3]
+        except OSError:
+            pass
+
+    excluded_files, excluded_extensions = exclusions
+    dir_mtimes = {}
+    candidates = {}
+    by_basename = {}
+    for root, dirs, files in os.walk(root_dir):
+        try:
+            dir_mtimes[root] = os.stat(root).st_mtime_ns
+        except OSError:
+            continue
+
+        # Filter out excluded directories
+        dirs[:] = [d for d in dirs if d not in excluded_files]
+
+        # Relative paths are built with os.path string operations, once per
+        # directory, rather than a Path per file
+        relative_root = os.path.relpath(root, root_dir)
+        for file in files:
+            # Skip excluded files
+            if file in excluded_files:
+                continue
+
+            # Skip excluded extensions
+            if os.path.splitext(file)[1].lower() in excluded_extensions:
+                continue
+
+            # Store relative path
+            relative_path = file if relative_root == os.curdir else os.path.join(relative_root, file)
+            candidates[relative_path] = processor(relative_path)
+            by_basename.setdefault(file.lower(), []).append(relative_path)
+
+    _CANDIDATES_CACHE[root_dir] = (dir_mtimes, exclusions, candidates, by_basename)
+    return candidates, by_basename
+
+
+def _ratio_length_bounds(length: int, min_score: float) -> tuple[float, float]:
+    """
+    Get the candidate lengths that can still reach min_score under fuzz.ratio.
+
+    fuzz.ratio is 100 * (1 - indel_distance / (len1 + len2)) and the distance is
+    at least the length difference, so the score is capped at
+    200 * min(len1, len2) / (len1 + len2).
+    """
+    if min_score <= 0:
+        return 0, float("inf")
+    return length * min_score / (200 - min_score), length * (200 - min_score) / min_score
+
+
 def find_best_matching_file(root_dir: Path, user_path: str, config: Config, min_score: int = None) -> str | None:
     """
     Find the best matching file using fuzzy matching.
@@ -291,41 +410,43 @@ def find_best_matching_file(root_dir: Path, user_path: str, config: Config, min_
         min_score = config.min_fuzzy_score
 
     try:
-        from thefuzz import fuzz
-        from thefuzz import process as fuzzy_process
-
-        # Collect all files
-        all_files = []
-        for root, dirs, files in os.walk(root_dir):
-            # Filter out excluded directories
-            dirs[:] = [d for d in dirs if d not in config.excluded_files]
-
-            for file in files:
-                file_path = Path(root) / file
-
-                # Skip excluded files
-                if file in config.excluded_files:
-                    continue
-
-                # Skip excluded extensions
-                if file_path.suffix.lower() in config.excluded_extensions:
-                    continue
-
-                # Store relative path
-                try:
-                    relative_path = file_path.relative_to(root_dir)
-                    all_files.append(str(relative_path))
-                except ValueError:
-                    continue
+        # thefuzz's backend, called directly so score_cutoff prunes inside the C scorer.
+        # Its ratio is already a bit-parallel (64 chars per word) Indel distance, so
+        # there is no scalar edit-distance loop left to specialize here.
+        from rapidfuzz import fuzz, process, utils
 
+        all_files, by_basename = _get_fuzzy_candidates(root_dir, config, utils.default_process)
         if not all_files:
             return None
 
-        # Find best match
-        best_match, score = fuzzy_process.extractOne(user_path, all_files, scorer=fuzz.ratio)
+        # A bare file name that names exactly one file needs no scoring
+        if '/' not in user_path and '\\' not in user_path:
+            same_name = by_basename.get(user_path.strip().lower())
+            if same_name is not None and len(same_name) == 1:
+                return str(root_dir / same_name[0])
+
+        # Only score candidates whose length can still reach min_score
+        query = utils.default_process(user_path)
+        min_length, max_length = _ratio_length_bounds(len(query), min_score)
+        candidates = {
+            file: processed
+            for file, processed in all_files.items()
+            if min_length <= len(processed) <= max_length
+        }
 
-        if score >= min_score:
-            return str(root_dir / best_match)
+        # Find best match; candidates scoring below min_score are abandoned early.
+        # ASCII str is already one byte per char, which rapidfuzz scores as an
+        # 8-bit buffer, so encoding candidates to bytes would only add a copy.
+        match = process.extractOne(
+            query,
+            candidates,
+            scorer=fuzz.ratio,
+            processor=None,
+            score_cutoff=min_score,
+        )
+
+        if match is not None:
+            return str(root_dir / match[2])
 
         return None
 
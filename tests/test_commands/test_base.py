@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+
+"""
+Tests for base command classes and the command registry
+"""
+
+import sys
+
+import pytest
+
+from src.commands import create_command_registry
+from src.commands.base import CommandRegistry, CommandResult, has_command_prefix
+from src.commands.context_commands import ContextCommand
+from src.commands.file_commands import AddCommand
+from src.commands.system_commands import ClearContextCommand, ExitCommand, MaxStepsCommand
+from src.core.config import Config
+
+
+class TestExactPatternMatching:
+    """Test matching of commands declaring exact_patterns."""
+
+    def test_matches_ignores_case_and_whitespace(self):
+        command = ContextCommand(Config())
+
+        assert command.matches("/context")
+        assert command.matches("  /CONTEXT \n")
+        assert not command.matches("/context-mode")
+        assert not command.matches("")
+
+    def test_matches_normalized_checks_all_aliases(self):
+        command = ExitCommand(Config())
+
+        assert command.matches_normalized("/exit")
+        assert command.matches_normalized("/quit")
+        assert not command.matches_normalized("/EXIT")  # input must already be normalized
+
+    def test_prefix_command_falls_back_to_matches(self):
+        command = AddCommand(Config())
+
+        assert command.matches_normalized("/add foo.py")
+        assert not command.matches_normalized("/address")
+
+    def test_prefix_commands_agree_on_raw_and_normalized_input(self):
+        commands = [AddCommand(Config()), ClearContextCommand(Config()), MaxStepsCommand(Config())]
+        inputs = ["/add foo.py", "/clear", "/clear -y", "/clearall", "/max-steps 5", "/max-steps", "", "/add"]
+
+        for command in commands:
+            for text in inputs:
+                assert command.matches(f"  {text.upper()} ") == command.matches_normalized(text)
+
+
+class TestHasCommandPrefix:
+    """Test the case-insensitive prefix helper used by commands with arguments."""
+
+    def test_matches_like_strip_lower_startswith(self):
+        for text in ["/add foo.py", "  /ADD Foo.py", "/Add", "/address", "", "/add "]:
+            assert has_command_prefix(text, "/add ") == text.strip().lower().startswith("/add ")
+
+    def test_non_ascii_input(self):
+        assert has_command_prefix("/FOLDER Ünïcode", "/folder ")
+        assert not has_command_prefix("Ünïcode", "/folder ")
+
+
+class TestCommandRegistration:
+    """Test how commands are instantiated by create_command_registry."""
+
+    def test_one_instance_per_command_class(self):
+        """Each command class is registered exactly once and reused."""
+        registry = create_command_registry(Config())
+        classes = [type(cmd) for cmd in registry.commands]
+
+        assert len(classes) == len(set(classes))
+        assert registry.find_command("/context") is registry.find_command("/context")
+
+
+class TestCommandRegistryDispatch:
+    """Test command lookup in CommandRegistry."""
+
+    def test_normalize_input_interns(self):
+        normalized = CommandRegistry.normalize_input("  /CONTEXT ")
+
+        assert normalized == "/context"
+        assert normalized is sys.intern("/context")
+
+    def test_exact_patterns_interned_on_register(self):
+        """Patterns built at runtime are interned like the normalized input."""
+        registry = CommandRegistry(Config())
+        context = ContextCommand(Config())
+        context.exact_patterns = ("".join(["/ctx", "-alias"]),)
+        registry.register(context)
+
+        (pattern,) = registry._exact_index
+        assert pattern is CommandRegistry.normalize_input("/CTX-ALIAS")
+        assert registry.find_command("/ctx-alias") is context
+
+    def test_earlier_prefix_command_wins_over_exact(self):
+        """Registration order decides between a prefix and an exact match."""
+        registry = CommandRegistry(Config())
+        add = AddCommand(Config())
+        context = ContextCommand(Config())
+        add.matches_normalized = lambda normalized: True
+        add.get_match_prefix = lambda: ""
+        registry.register(add)
+        registry.register(context)
+
+        assert registry.find_command("/context") is add
+
+    def test_non_command_input_skips_normalization(self, monkeypatch):
+        registry = create_command_registry(Config())
+        monkeypatch.setattr(CommandRegistry, "normalize_input",
+                            staticmethod(lambda user_input: pytest.fail("normalized")))
+
+        assert registry.find_command("Please explain /context to me") is None
+        assert registry.find_command("") is None
+
+    def test_exact_command_skips_later_prefix_commands(self):
+        registry = CommandRegistry(Config())
+        context = ContextCommand(Config())
+        add = AddCommand(Config())
+        registry.register(context)
+        registry.register(add)
+
+        assert registry.find_command("/CONTEXT") is context
+        assert registry.find_command("/add foo.py") is add
+
+    def test_prefix_commands_tried_only_on_prefix_match(self):
+        """A command taking arguments isn't tried unless the input starts with its prefix."""
+        registry = CommandRegistry(Config())
+        add = AddCommand(Config())
+        calls = []
+        add.matches_normalized = lambda normalized: calls.append(normalized) or True
+        registry.register(add)
+
+        assert registry.find_command("/remove foo.py") is None
+        assert registry.find_command("/ad") is None
+        assert calls == []
+        assert registry.find_command("/add foo.py") is add
+        assert calls == ["/add foo.py"]
+
+    def test_prefix_candidates_keep_registration_order(self):
+        registry = CommandRegistry(Config())
+        catch_all = AddCommand(Config())
+        catch_all.get_match_prefix = lambda: ""
+        catch_all.matches_normalized = lambda normalized: normalized.startswith("/add")
+        add = AddCommand(Config())
+        registry.register(catch_all)
+        registry.register(add)
+
+        assert registry.find_command("/add foo.py") is catch_all
+
+    def test_find_command_is_case_insensitive(self):
+        registry = create_command_registry(Config())
+
+        assert registry.find_command("  /Context ").get_pattern() == "/context"
+        assert registry.find_command("/ADD foo.py").get_pattern() == "/add "
+        assert registry.find_command("hello") is None
+
+    def test_uppercase_command_keeps_arguments(self):
+        """Default prefix commands match any case and keep the argument text."""
+        registry = create_command_registry(Config())
+
+        command = registry.find_command("/PLAN Build X")
+
+        assert command.get_pattern() == "/plan"
+        assert command.matches("/PLAN Build X")
+        assert command.extract_arguments("/PLAN Build X") == "Build X"
+
+
+class TestCommandResult:
+    """Test CommandResult factories."""
+
+    def test_plain_ok_is_shared(self):
+        assert CommandResult.ok() is CommandResult.ok()
+        assert CommandResult.ok().success
+
+    def test_ok_with_payload_is_new_instance(self):
+        result = CommandResult.ok("done", data={"n": 1})
+
+        assert result is not CommandResult.ok()
+        assert result.message == "done"
+        assert result.data == {"n": 1}
+
+    def test_results_are_immutable(self):
+        with pytest.raises(AttributeError):
+            CommandResult.ok().success = False
+
+    def test_default_result_is_success(self):
+        assert CommandResult(should_continue=True).success is True
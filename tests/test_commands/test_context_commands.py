@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+
+"""
+Tests for context management commands
+"""
+
+from unittest.mock import Mock, patch
+
+from src.commands.context_commands import ContextCommand, ContextModeCommand, LogCommand
+from src.core.config import Config
+from src.core.session import GrokSession
+
+
+def make_context_info(critical: bool = False, approaching: bool = False, mounted: int = 0) -> dict:
+    """Helper to build a context info dict as returned by get_context_info()."""
+    return {
+        'model': 'grok-4-1-fast-non-reasoning',
+        'messages': 5,
+        'estimated_tokens': 1234,
+        'max_tokens': 128000,
+        'token_usage_percent': 1.0,
+        'critical_limit': critical,
+        'approaching_limit': approaching,
+        'mounted_files_count': mounted,
+        'mounted_files_tokens': 100 * mounted,
+    }
+
+
+class TestContextCommand:
+    """Test /context command output."""
+
+    @patch('src.ui.console.get_console')
+    def test_prints_once_with_recommendations(self, mock_console):
+        """Table, warning and mounted-files tip are rendered in a single print."""
+        console = Mock()
+        mock_console.return_value = console
+
+        session = Mock(spec=GrokSession)
+        session.get_context_info.return_value = make_context_info(critical=True, mounted=2)
+
+        result = ContextCommand(Config()).execute("/context", session)
+
+        assert result.success
+        console.print.assert_called_once()
+
+    @patch('src.ui.console.get_console')
+    def test_piped_output_is_plain_text(self, mock_console):
+        """Without a terminal the stats are printed as unstyled lines."""
+        console = Mock(is_terminal=False)
+        mock_console.return_value = console
+
+        session = Mock(spec=GrokSession)
+        session.get_context_info.return_value = make_context_info(critical=True, mounted=2)
+
+        result = ContextCommand(Config()).execute("/context", session)
+
+        assert result.success
+        text = console.print.call_args[0][0]
+        assert isinstance(text, str)
+        assert "Model: grok-4-1-fast-non-reasoning" in text
+        assert "Mounted Files Tokens: 200" in text
+        assert "Status: 🔴 Critical" in text
+        assert "Context is critical!" in text
+        assert "─" not in text
+        assert console.print.call_args[1]["markup"] is False
+
+
+class TestContextModeCommand:
+    """Test /context-mode command output."""
+
+    @patch('src.ui.console.get_console')
+    def test_prints_once(self, mock_console):
+        """Mode line, table and command help are rendered in a single print."""
+        console = Mock()
+        mock_console.return_value = console
+
+        session = Mock(spec=GrokSession)
+        session.get_context_mode.return_value = "smart_truncation"
+
+        result = ContextModeCommand(Config()).execute("/context-mode", session)
+
+        assert result.success
+        console.print.assert_called_once()
+
+    @patch('src.ui.console.get_console')
+    def test_piped_output_marks_active_mode(self, mock_console):
+        console = Mock(is_terminal=False)
+        mock_console.return_value = console
+
+        session = Mock(spec=GrokSession)
+        session.get_context_mode.return_value = "smart_truncation"
+
+        ContextModeCommand(Config()).execute("/context-mode", session)
+
+        text = console.print.call_args[0][0]
+        assert "Current Context Mode: smart_truncation" in text
+        assert "smart_truncation (active):" in text
+        assert "cache_optimized (active)" not in text
+
+
+class TestLogCommand:
+    """Test /log command message selection."""
+
+    @patch('src.ui.formatters.format_conversation_log')
+    @patch('src.ui.console.get_console')
+    def test_shows_last_ten_non_system_messages(self, mock_console, mock_format):
+        """Only non-system messages from the last ten are passed to the formatter."""
+        history = [{"role": "system", "content": "prompt"}]
+        history += [{"role": "user", "content": f"message {i}"} for i in range(15)]
+        history.append({"role": "system", "content": "note"})
+
+        session = Mock(spec=GrokSession)
+        session.get_conversation_history.return_value = history
+
+        result = LogCommand(Config()).execute("/log", session)
+
+        assert result.success
+        shown = mock_format.call_args[0][0]
+        assert [m["content"] for m in shown] == [f"message {i}" for i in range(6, 15)]
+
+    @patch('src.ui.formatters.format_conversation_log')
+    @patch('src.ui.console.get_console')
+    def test_piped_output_skips_formatter(self, mock_console, mock_format):
+        console = Mock(is_terminal=False)
+        mock_console.return_value = console
+
+        session = Mock(spec=GrokSession)
+        session.get_conversation_history.return_value = [
+            {"role": "user", "content": "hi"},
+            {"role": "assistant", "content": "hello"},
+        ]
+
+        LogCommand(Config()).execute("/log", session)
+
+        mock_format.assert_not_called()
+        assert console.print.call_args[0][0] == "1. user: hi\n2. assistant: hello"
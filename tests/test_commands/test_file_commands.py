@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+"""
+Tests for file operation commands
+"""
+
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.commands.file_commands import AddCommand
+from src.core.session import GrokSession
+from src.utils.file_utils import safe_file_read
+
+
+@pytest.fixture
+def tree(temp_dir):
+    """Create a small project tree with excluded entries."""
+    (temp_dir / "a.py").write_text("a")
+    (temp_dir / "pkg").mkdir()
+    (temp_dir / "pkg" / "b.py").write_text("b")
+    (temp_dir / "pkg" / "image.png").write_bytes(b"\x89PNG")
+    (temp_dir / "node_modules").mkdir()
+    (temp_dir / "node_modules" / "dep.js").write_text("dep")
+    (temp_dir / "z.txt").write_text("z")
+    return temp_dir
+
+
+class TestAddCommandWalk:
+    """Test the directory walk used by /add <dir>."""
+
+    def test_matches_os_walk(self, mock_config, tree):
+        """Same files as the previous os.walk loop, in the same order."""
+        expected = []
+        for root, dirs, files in os.walk(tree):
+            dirs[:] = [d for d in dirs if d not in mock_config.excluded_files]
+            for file in files:
+                if file in mock_config.excluded_files:
+                    continue
+                if os.path.splitext(file)[1].lower() in mock_config.excluded_extensions:
+                    continue
+                expected.append(os.path.join(root, file))
+
+        walked = [path for path, _ in AddCommand(mock_config)._walk_files(str(tree))]
+
+        assert walked == expected
+        assert str(tree / "pkg" / "b.py") in walked
+        assert not any("node_modules" in p or p.endswith(".png") for p in walked)
+
+    def test_does_not_follow_directory_symlinks(self, mock_config, tree):
+        (tree / "link").symlink_to(tree / "pkg", target_is_directory=True)
+
+        walked = [path for path, _ in AddCommand(mock_config)._walk_files(str(tree))]
+
+        assert not any(p.startswith(str(tree / "link")) for p in walked)
+
+    @patch('src.ui.console.get_prompt_session')
+    @patch('src.ui.console.get_console')
+    def test_mount_respects_file_limit(self, mock_console, mock_prompt, mock_config, tree):
+        mock_config.max_files_in_add_dir = 2
+        session = Mock(spec=GrokSession)
+
+        result = AddCommand(mock_config).execute(f"/add {tree}", session)
+
+        assert result.success
+        assert session.mount_file.call_count == 2
+
+    def test_walk_reports_sizes(self, mock_config, tree):
+        sizes = dict(AddCommand(mock_config)._walk_files(str(tree)))
+
+        assert sizes[str(tree / "a.py")] == 1
+
+    @patch('src.ui.console.get_prompt_session')
+    @patch('src.ui.console.get_console')
+    def test_mount_skips_files_over_size_budget(self, mock_console, mock_prompt, mock_config, tree):
+        """Files that would exceed the budget are skipped without being read."""
+        (tree / "pkg" / "big.py").write_text("x" * 100)
+        mock_config.max_multiple_read_size = 2
+        session = Mock(spec=GrokSession)
+
+        with patch('src.utils.file_utils.safe_file_read', wraps=safe_file_read) as mock_read:
+            AddCommand(mock_config).execute(f"/add {tree}", session)
+
+        read_paths = [c.args[0] for c in mock_read.call_args_list]
+        mounted = [c.args[0] for c in session.mount_file.call_args_list]
+        assert str(tree / "pkg" / "big.py") not in read_paths
+        assert sorted(mounted) == [str(tree / "a.py"), str(tree / "z.txt")]  # root files come first
+
+    @patch('src.commands.file_commands._MAX_SKIPPED_FILES', 2)
+    @patch('src.ui.console.get_prompt_session')
+    @patch('src.ui.console.get_console')
+    def test_mount_stops_walking_after_skip_limit(self, mock_console, mock_prompt, mock_config, tree):
+        """Once enough files don't fit, the rest of the tree is not scanned."""
+        mock_config.max_multiple_read_size = 3
+        late = (str(tree / "z.txt"), 1)
+        files = iter([(str(tree / "a.py"), 1), (str(tree / "big1.py"), 100), (str(tree / "big2.py"), 100), late])
+        session = Mock(spec=GrokSession)
+
+        with patch.object(AddCommand, '_walk_files', return_value=files):
+            AddCommand(mock_config).execute(f"/add {tree}", session)
+
+        assert [c.args[0] for c in session.mount_file.call_args_list] == [str(tree / "a.py")]
+        assert next(files) == late
@@ -6,9 +6,18 @@ Tests for Memory Commands
 Critical path tests for memory command handlers.
 """
 
+import json
+from unittest.mock import Mock, patch
+
 import pytest
 
-from src.commands.memory_commands import MemoryCommand
+from src.commands.memory_commands import (
+    _MEMORY_PAGE_SIZE,
+    MemoryCommand,
+    _memory_row,
+    _memory_type_name,
+)
+from src.core.session import GrokSession
 
 
 @pytest.fixture
@@ -70,3 +79,174 @@ def test_base_command_interface(mock_config):
     assert cmd.get_pattern() == "/test"
     assert cmd.get_description() == "Test command"
     assert cmd.matches("/test foo") is True
+
+
+@patch('src.ui.console.get_prompt_session')
+@patch('src.ui.console.get_console')
+def test_memory_lists_fetched_once_between_changes(mock_console, mock_prompt, memory_command):
+    """Repeated listings reuse the fetched memories until one is saved."""
+    mock_prompt.return_value.prompt.side_effect = [
+        "1", "1",  # list twice
+        "4", "remember this", "3", "g",  # save a global memory
+        "1", "q",
+    ]
+    session = Mock(spec=GrokSession)
+    memory_manager = session.get_memory_manager.return_value
+    memory_manager.get_all_memories.return_value = []
+
+    result = memory_command.execute("/memory", session)
+
+    assert result.success
+    memory_manager.save_memory.assert_called_once_with("remember this", "important_fact", "global")
+    assert memory_manager.get_all_memories.call_count == 2
+
+
+@patch('src.ui.console.get_prompt_session')
+@patch('src.ui.console.get_console')
+def test_memory_lists_not_shared_between_runs(mock_console, mock_prompt, memory_command):
+    """Each /memory run fetches fresh lists."""
+    mock_prompt.return_value.prompt.side_effect = ["1", "q", "1", "q"]
+    session = Mock(spec=GrokSession)
+    memory_manager = session.get_memory_manager.return_value
+    memory_manager.get_all_memories.return_value = []
+
+    memory_command.execute("/memory", session)
+    memory_command.execute("/memory", session)
+
+    assert memory_manager.get_all_memories.call_count == 2
+
+
+def test_memory_row_truncates_content_and_date():
+    memory = {
+        "id": "mem_1",
+        "type": "user_preference",
+        "content": "x" * 70,
+        "created": "2025-01-02T03:04:05",
+        "scope": "global",
+    }
+
+    assert _memory_row(memory, 60) == ("mem_1", "User Preference", "x" * 60 + "...", "2025-01-02")
+    assert _memory_row(memory, 80, include_scope=True) == (
+        "mem_1", "User Preference", "global", "x" * 70, "2025-01-02"
+    )
+
+
+def test_memory_row_defaults_missing_fields():
+    assert _memory_row({}, 50, include_scope=True) == ("", "", "directory", "", "")
+
+
+def test_list_memories_empty_prints_message(memory_command):
+    console = Mock()
+
+    memory_command._list_memories(console, Mock(), [], "Memories", "No memories found.")
+
+    console.print.assert_called_once_with("[yellow]No memories found.[/yellow]")
+
+
+def test_memory_pages_small_list_prints_once(memory_command):
+    console = Mock()
+    prompt_session = Mock()
+
+    memory_command._list_memories(console, prompt_session, [{"id": "mem_1"}], "Memories", "None")
+
+    assert console.print.call_count == 1
+    prompt_session.prompt.assert_not_called()
+
+
+def test_memory_pages_navigate_large_list(memory_command):
+    """Large lists are shown a page at a time, moving on user input."""
+    console = Mock()
+    prompt_session = Mock()
+    prompt_session.prompt.side_effect = ["n", "p", "q"]
+    memories = [{"id": f"mem_{i}"} for i in range(_MEMORY_PAGE_SIZE * 2 + 1)]
+
+    memory_command._list_memories(console, prompt_session, memories, "Memories", "None")
+
+    tables = [c.args[0] for c in console.print.call_args_list]
+    assert [table.caption for table in tables] == ["Page 1 of 3", "Page 2 of 3", "Page 1 of 3"]
+    assert tables[0].row_count == _MEMORY_PAGE_SIZE
+    assert tables[1].columns[0]._cells[0] == f"mem_{_MEMORY_PAGE_SIZE}"
+
+
+def test_export_memories_writes_json(memory_command, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    console = Mock()
+    memory_manager = Mock()
+    export_data = {
+        "global_memories": [{"id": "mem_1", "content": "café"}],
+        "directory_memories": {"/project": [{"id": "mem_2"}, {"id": "mem_3"}]},
+    }
+    memory_manager.export_memories.return_value = export_data
+
+    memory_command._export_memories(console, memory_manager)
+
+    [export_file] = tmp_path.glob("grok_memories_export_*.json")
+    assert json.loads(export_file.read_text(encoding="utf-8")) == export_data
+    assert "Exported 3 memories" in console.print.call_args.args[0]
+
+
+@patch('src.ui.console.get_prompt_session')
+@patch('src.ui.console.get_console')
+def test_clear_all_counts_current_directory_and_global(mock_console, mock_prompt, memory_command):
+    mock_prompt.return_value.prompt.side_effect = ["6", "3", "n", "q"]
+    session = Mock(spec=GrokSession)
+    memory_manager = session.get_memory_manager.return_value
+    memory_manager.get_directory_memories.return_value = [{"id": "mem_1"}]
+    memory_manager.get_global_memories.return_value = [{"id": "mem_2"}, {"id": "mem_3"}]
+
+    memory_command.execute("/memory", session)
+
+    mock_prompt.return_value.prompt.assert_any_call("Clear ALL 3 memories? (y/N): ")
+    memory_manager.get_all_memories.assert_not_called()
+    memory_manager.clear_global_memories.assert_not_called()
+
+
+def test_import_memories_reads_memory_file(memory_command, tmp_path):
+    source = tmp_path / "other"
+    source.mkdir()
+    memories = [{"id": "mem_1", "content": "naïve"}]
+    (source / ".grok_memory.json").write_text(json.dumps({"memories": memories}), encoding="utf-8")
+    console = Mock()
+    prompt_session = Mock()
+    prompt_session.prompt.side_effect = [str(source), "m"]
+    memory_manager = Mock(current_directory=tmp_path)
+    memory_manager.import_memories.return_value = {"directory_imported": 1}
+
+    memory_command._import_memories(console, prompt_session, memory_manager)
+
+    memory_manager.import_memories.assert_called_once_with(
+        {"directory_memories": {str(tmp_path): memories}}, merge=True
+    )
+
+
+def test_memory_type_name_handles_unknown_types():
+    assert _memory_type_name("architectural_decision") == "Architectural Decision"
+    assert _memory_type_name("custom_kind") == "Custom Kind"
+    assert _memory_type_name("") == ""
+
+
+@patch('src.ui.console.get_prompt_session')
+@patch('src.ui.console.get_console')
+def test_statistics_rebuilt_only_after_changes(mock_console, mock_prompt, memory_command):
+    mock_prompt.return_value.prompt.side_effect = [
+        "9", "9",
+        "5", "",  # remove prompt, cancelled without an ID
+        "9", "q",
+    ]
+    session = Mock(spec=GrokSession)
+    memory_manager = session.get_memory_manager.return_value
+    memory_manager.get_all_memories.return_value = [{"id": "mem_1"}]
+    memory_manager.get_memory_statistics.return_value = {
+        "global_memories": 1,
+        "current_directory_memories": 0,
+        "total_directory_memories": 0,
+        "total_directories_with_memories": 0,
+        "total_memories": 1,
+        "current_directory": "/project",
+        "memory_types": {"important_fact": 1},
+    }
+
+    memory_command.execute("/memory", session)
+
+    assert memory_manager.get_memory_statistics.call_count == 2
+    mock_console.return_value.print.assert_any_call("\n[bold]Memory Types:[/bold]\n  Important Fact: 1")
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+
+"""
+Tests for system commands
+"""
+
+from unittest.mock import Mock, patch
+
+from src.commands.system_commands import (
+    _SELF_MODE_INSTRUCTIONS,
+    ClearContextCommand,
+    HelpCommand,
+    JobsCommand,
+    MaxStepsCommand,
+    OsCommand,
+    ReloadToolsCommand,
+    SelfModeCommand,
+)
+from src.core.config import Config
+from src.core.session import GrokSession
+
+
+def make_session(messages: int = 3) -> Mock:
+    """Helper to create a mock session with a conversation history."""
+    session = Mock(spec=GrokSession)
+    session.message_count = messages
+    session.file_context_count = 0
+    return session
+
+
+class TestCommandSlots:
+    """Test that stateless system commands carry no instance __dict__."""
+
+    def test_no_instance_dict(self):
+        for command_class in (ClearContextCommand, HelpCommand, JobsCommand, MaxStepsCommand,
+                              ReloadToolsCommand, SelfModeCommand):
+            assert not hasattr(command_class(Config()), "__dict__")
+
+
+class TestClearContextCommand:
+    """Test /clear command."""
+
+    def test_matches_with_arguments(self):
+        command = ClearContextCommand(Config())
+
+        assert command.matches("/clear")
+        assert command.matches("/CLEAR context")
+        assert command.matches("/clear -y")
+        assert command.matches("/clear --yes")
+        assert command.matches("/clear context -y")
+        assert not command.matches("/clear foo")
+        assert not command.matches("/clearall")
+        assert not command.matches("")
+
+    @patch('src.ui.console.get_prompt_session')
+    @patch('src.ui.console.get_console')
+    def test_yes_flag_skips_prompt(self, mock_console, mock_prompt):
+        """-y/--yes clears without asking for confirmation."""
+        session = make_session()
+
+        for user_input in ("/clear -y", "/clear context --yes"):
+            ClearContextCommand(Config()).execute(user_input, session)
+
+        mock_prompt.assert_not_called()
+        assert session.clear_context.call_count == 2
+
+    @patch('src.ui.console.get_prompt_session')
+    @patch('src.ui.console.get_console')
+    def test_prompts_without_flag(self, mock_console, mock_prompt):
+        """Without a flag the user is asked and can cancel."""
+        mock_prompt.return_value.prompt.return_value = "n"
+        session = make_session()
+
+        ClearContextCommand(Config()).execute("/clear", session)
+
+        mock_prompt.return_value.prompt.assert_called_once()
+        session.clear_context.assert_not_called()
+
+
+class TestOsCommand:
+    """Test /os command."""
+
+    @patch('src.ui.console.get_console')
+    def test_prints_once(self, mock_console):
+        """Both tables and the working directory go out in a single print."""
+        config = Config()
+
+        OsCommand(config).execute("/os", make_session())
+
+        mock_console.return_value.print.assert_called_once()
+        [group] = mock_console.return_value.print.call_args.args
+        os_table, shell_table, cwd = group.renderables
+        assert os_table.row_count == 6
+        assert shell_table.row_count == len(config.os_info['shell_available'])
+        assert str(config.base_dir) in cwd.plain
+
+    @patch('src.ui.console.get_console')
+    def test_tables_reused_and_cwd_current(self, mock_console, tmp_path):
+        config = Config()
+        command = OsCommand(config)
+
+        command.execute("/os", make_session())
+        config.base_dir = tmp_path
+        command.execute("/os", make_session())
+
+        first, second = [c.args[0].renderables for c in mock_console.return_value.print.call_args_list]
+        assert first[0] is second[0] and first[1] is second[1]
+        assert str(tmp_path) in second[2].plain
+
+    @patch('src.ui.console.get_console')
+    def test_render_reused_while_base_dir_unchanged(self, mock_console):
+        command = OsCommand(Config())
+
+        command.execute("/os", make_session())
+        command.execute("/os", make_session())
+
+        first, second = [c.args[0] for c in mock_console.return_value.print.call_args_list]
+        assert first is second
+
+
+class TestHelpCommand:
+    """Test /help command."""
+
+    @patch('src.ui.console.get_console')
+    def test_panel_reused_per_fuzzy_state(self, mock_console):
+        config = Config()
+        command = HelpCommand(config)
+
+        config.fuzzy_enabled_by_default = True
+        command.execute("/help", make_session())
+        command.execute("/help", make_session())
+        config.fuzzy_enabled_by_default = False
+        command.execute("/help", make_session())
+
+        first, second, third = [c.args[0] for c in mock_console.return_value.print.call_args_list]
+        assert first is second
+        assert "(currently: enabled)" in first.renderable
+        assert "(currently: disabled)" in third.renderable
+
+
+class TestOptionalManagers:
+    """Test commands that depend on managers attached to the config later."""
+
+    @patch('src.ui.console.get_console')
+    def test_jobs_without_background_manager(self, mock_console):
+        result = JobsCommand(Config()).execute("/jobs", make_session())
+
+        assert result.success
+        mock_console.return_value.print.assert_called_once_with("[yellow]No background jobs running[/yellow]")
+
+    @patch('src.ui.console.get_console')
+    def test_jobs_truncates_long_commands(self, mock_console):
+        config = Config()
+        job = Mock(job_id=1, status="running", shell_type="bash", command="x" * 61)
+        job.is_running.return_value = True
+        job.get_runtime.return_value = 1.25
+        config._background_manager = Mock(list_jobs=Mock(return_value=[job]))
+
+        JobsCommand(config).execute("/jobs", make_session())
+
+        table = mock_console.return_value.print.call_args.args[0].renderables[0]
+        assert list(table.columns[4].cells) == ["x" * 60 + "..."]
+        assert list(table.columns[3].cells) == ["1.2s"]
+
+    @patch('src.ui.console.get_console')
+    def test_reload_tools_without_registry(self, mock_console):
+        result = ReloadToolsCommand(Config()).execute("/reload-tools", make_session())
+
+        assert not result.success
+        assert result.message == "Tool registry not initialized"
+
+
+class TestSelfModeCommand:
+    """Test /self command."""
+
+    @patch('src.ui.console.get_console')
+    def test_toggle_on_adds_instructions(self, mock_console):
+        config = Config()
+        session = make_session()
+        command = SelfModeCommand(config)
+
+        command.execute("/self", session)
+        command.execute("/self", session)
+
+        assert config.self_mode is False
+        session.add_message.assert_called_once_with("system", _SELF_MODE_INSTRUCTIONS)
+
+    @patch('src.ui.console.get_console')
+    def test_each_toggle_prints_once(self, mock_console):
+        command = SelfModeCommand(Config())
+
+        command.execute("/self", make_session())
+        command.execute("/self", make_session())
+
+        on, off = [c.args[0] for c in mock_console.return_value.print.call_args_list]
+        assert on.count("\n") == 2 and "enabled" in on
+        assert off.count("\n") == 1 and "disabled" in off
+
+
+class TestMaxStepsCommand:
+    """Test /max-steps command."""
+
+    @patch('src.ui.console.get_console')
+    def test_show_unlimited_setting(self, mock_console):
+        config = Config()
+        config.max_reasoning_steps = 999999
+
+        MaxStepsCommand(config).execute("/max-steps", make_session())
+
+        mock_console.return_value.print.assert_called_once_with(
+            "[cyan]Current maximum reasoning steps: Unlimited[/cyan]\n"
+            "[dim]Usage: /max-steps <number> or /max-steps unlimited[/dim]"
+        )
@@ -118,6 +118,13 @@ class TestAppContextDependencyManagement:
         assert context.command_registry == mock_registry
         assert context.tool_executor == mock_executor
 
+    def test_rejects_undeclared_attributes(self):
+        """AppContext uses slots, so typos in attribute names fail loudly."""
+        context = AppContext.create_testing()
+
+        with pytest.raises(AttributeError):
+            context.comand_registry = {}
+
 
 class TestAppContextUIAdapter:
     """Test UI adapter integration in AppContext."""
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+
+"""
+Tests for BackgroundProcessManager job tracking and output capture
+"""
+
+import shutil
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.core.background_manager import BackgroundProcessManager
+
+pytestmark = pytest.mark.skipif(shutil.which("bash") is None, reason="bash not available")
+
+
+def wait_for_output(manager: BackgroundProcessManager, job_id: int, stdout_lines: int, stderr_lines: int = 0,
+                    timeout: float = 5.0) -> dict:
+    """Poll a job until it has finished and captured the expected output lines."""
+    deadline = time.monotonic() + timeout
+    while True:
+        output = manager.get_job_output(job_id)
+        if (not output["is_running"] and output["stdout_lines"] >= stdout_lines
+                and output["stderr_lines"] >= stderr_lines):
+            return output
+        if time.monotonic() > deadline:
+            pytest.fail(f"job {job_id} did not finish: {output}")
+        time.sleep(0.01)
+
+
+class TestOutputCapture:
+    """Test capture of job stdout and stderr."""
+
+    def test_captures_stdout_and_stderr(self):
+        manager = BackgroundProcessManager()
+        job_id = manager.start_job("printf 'one\\ntwo  \\n'; echo oops >&2")
+
+        output = wait_for_output(manager, job_id, stdout_lines=2, stderr_lines=1)
+
+        assert output["stdout"] == "one\ntwo"
+        assert output["stderr"] == "oops"
+        assert output["status"] == "completed"
+        assert output["exit_code"] == 0
+
+    def test_many_lines_captured_in_order(self):
+        manager = BackgroundProcessManager()
+        job_id = manager.start_job("seq 1 2000")
+
+        output = wait_for_output(manager, job_id, stdout_lines=2000)
+
+        assert output["stdout"].split("\n") == [str(i) for i in range(1, 2001)]
+
+    def test_buffer_keeps_last_lines_and_counts_all(self):
+        manager = BackgroundProcessManager()
+        with patch('src.core.background_manager._MAX_BUFFERED_LINES', 100):
+            job_id = manager.start_job("seq 1 250")
+
+        output = wait_for_output(manager, job_id, stdout_lines=250)
+
+        assert output["stdout"].split("\n") == [str(i) for i in range(151, 251)]
+        assert output["stderr_lines"] == 0
+
+    def test_line_endings_and_unterminated_last_line(self):
+        manager = BackgroundProcessManager()
+        job_id = manager.start_job("printf 'a\\r\\nb\\rc\\n\\nlast'")
+
+        wait_for_output(manager, job_id, stdout_lines=5)
+
+        assert list(manager.get_job(job_id).output_buffer) == ["a", "b", "c", "", "last"]
+
+    def test_output_visible_while_running(self):
+        manager = BackgroundProcessManager()
+        job_id = manager.start_job("echo first; sleep 10")
+        try:
+            deadline = time.monotonic() + 5
+            while not manager.get_job(job_id).output_buffer:
+                assert time.monotonic() < deadline, "output not captured while running"
+                time.sleep(0.01)
+
+            assert manager.get_job_output(job_id)["is_running"]
+            assert list(manager.get_job(job_id).output_buffer) == ["first"]
+        finally:
+            manager.kill_job(job_id)
+
+
+class TestJobLifecycle:
+    """Test job status tracking and cleanup."""
+
+    def test_finished_job_not_polled_again(self):
+        manager = BackgroundProcessManager()
+        job_id = manager.start_job("exit 3")
+        wait_for_output(manager, job_id, stdout_lines=0)
+        job = manager.get_job(job_id)
+
+        with patch.object(job.process, 'poll', side_effect=AssertionError("polled")):
+            assert not job.is_running()
+        assert (job.status, job.exit_code) == ("failed", 3)
+
+    def test_cleanup_removes_only_old_finished_jobs(self):
+        manager = BackgroundProcessManager()
+        old_id = manager.start_job("true")
+        new_id = manager.start_job("true")
+        running_id = manager.start_job("sleep 10")
+        try:
+            wait_for_output(manager, old_id, stdout_lines=0)
+            wait_for_output(manager, new_id, stdout_lines=0)
+            for job_id in (old_id, running_id):
+                manager.get_job(job_id).started_monotonic -= 7200
+
+            manager.cleanup_finished_jobs(max_age_seconds=3600)
+
+            assert [job.job_id for job in manager.list_jobs()] == [new_id, running_id]
+        finally:
+            manager.kill_job(running_id)
+
+    def test_list_jobs_reads_snapshot_without_lock(self):
+        manager = BackgroundProcessManager()
+        job_id = manager.start_job("true")
+
+        with manager._lock:
+            jobs = manager.list_jobs()
+
+        assert [job.job_id for job in jobs] == [job_id]
+
+
+class TestPowerShellJobs:
+    """Test PowerShell executable selection."""
+
+    def test_executable_resolved_once_without_subprocess(self):
+        manager = BackgroundProcessManager()
+
+        with patch('src.core.background_manager.shutil.which', return_value=None) as which, \
+                patch('src.core.background_manager.subprocess.Popen') as popen, \
+                patch('src.core.background_manager.threading.Thread'):
+            manager.start_job("Get-Date", shell_type="powershell")
+            manager.start_job("Get-Date", shell_type="powershell")
+
+        which.assert_called_once_with('pwsh')
+        assert [c.args[0][0] for c in popen.call_args_list] == ['powershell', 'powershell']
@@ -52,6 +52,30 @@ class TestConfig:
         assert isinstance(config.os_info['is_mac'], bool)
         assert isinstance(config.os_info['is_linux'], bool)
 
+    def test_platform_probed_once(self):
+        """Later configs reuse the platform details but get their own os_info."""
+        first = Config()
+
+        with patch('src.core.config.platform.processor', side_effect=AssertionError("probed")):
+            second = Config()
+
+        assert second.os_info['processor'] == first.os_info['processor']
+        assert second.os_info is not first.os_info
+
+    def test_shell_lookups_cached_per_path(self, monkeypatch):
+        """Shells are looked up once per PATH, not once per config."""
+        monkeypatch.setenv('PATH', '/nonexistent/grok-test-bin')
+
+        with patch('src.core.config.shutil.which', return_value=None) as which:
+            Config()
+            lookups = which.call_count
+            Config()
+            assert which.call_count == lookups
+
+            monkeypatch.setenv('PATH', '/nonexistent/grok-test-bin-2')
+            Config()
+            assert which.call_count == 2 * lookups
+
     def test_model_switching(self):
         """Test model switching functionality."""
         config = Config()
@@ -110,6 +134,14 @@ class TestConfig:
         assert ".png" in config.excluded_extensions
         assert ".log" in config.excluded_extensions
 
+    def test_default_exclusions_are_per_config_copies(self):
+        first, second = Config(), Config()
+
+        first.excluded_files.add("generated")
+
+        assert "generated" not in second.excluded_files
+        assert "generated" not in Config().excluded_files
+
     @patch('builtins.open', new_callable=mock_open, read_data='{"models": {"default_model": "custom-grok"}}')
     @patch('pathlib.Path.exists', return_value=True)
     def test_config_file_loading(self, mock_exists, mock_file):
@@ -129,6 +161,38 @@ class TestConfig:
         assert config.os_info['system'] in prompt
         assert "Core Principles" in prompt
 
+    def test_system_prompt_fallback_placeholders(self):
+        """Templates str.format() rejects still get environment details filled in."""
+        config = Config()
+        config.os_info['shell_available'] = {'bash': True, 'zsh': True, 'cmd': False}
+        template = (
+            "{os_info['system']} {os_info['release']} {os_info['machine']} "
+            "{os_info['python_version']} | Shells: "
+            "{', '.join([shell for shell, available in os_info['shell_available'].items() if available]) or 'None'}"
+        )
+
+        with patch.object(config, '_load_system_prompt', return_value=template):
+            prompt = config.get_system_prompt()
+
+        info = config.os_info
+        assert prompt == (f"{info['system']} {info['release']} {info['machine']} "
+                          f"{info['python_version']} | Shells: bash, zsh")
+
+    def test_system_prompt_reused_until_inputs_change(self, temp_dir):
+        config = Config()
+        first = config.get_system_prompt()
+
+        with patch('src.core.config.open', side_effect=AssertionError("reread"), create=True), \
+                patch.object(config, '_format_system_prompt', side_effect=AssertionError("reformatted")):
+            assert config.get_system_prompt() is first
+
+        config.base_dir = temp_dir
+        config.enable_git(branch="feature")
+        prompt = config.get_system_prompt()
+
+        assert prompt is not first
+        assert prompt == Config(base_dir=temp_dir, git_enabled=True, git_branch="feature").get_system_prompt()
+
     def test_tools_generation(self):
         """Test tool definitions."""
         config = Config()
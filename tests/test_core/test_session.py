@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+
+"""
+Tests for GrokSession bookkeeping (context info caching, counters, etc.)
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.commands.context_commands import LogCommand
+from src.core.config import Config
+from src.core.session import GrokSession
+
+
+@pytest.fixture
+def session(tmp_path):
+    """Create a GrokSession with memory managers and initial context patched out."""
+    config = Config()
+    config.base_dir = tmp_path
+
+    client = Mock()
+    client.chat.create = Mock(return_value=Mock())
+
+    with patch('src.core.session.GrokSession._add_initial_context'), \
+            patch('src.core.session.MemoryManager') as mock_memory, \
+            patch('src.core.session.EpisodicMemoryManager') as mock_episodic:
+        mock_memory.return_value.get_memories_for_context.return_value = []
+        mock_episodic.return_value.get_episodes_for_context.return_value = []
+        yield GrokSession(client, config)
+
+
+class TestContextInfoCache:
+    """Test memoization of get_context_info()."""
+
+    def test_repeated_calls_use_cache(self, session):
+        """Stats are computed once while the context is unchanged."""
+        with patch.object(session.context_manager, 'get_context_stats',
+                          wraps=session.context_manager.get_context_stats) as stats:
+            first = session.get_context_info()
+            second = session.get_context_info()
+
+        assert stats.call_count == 1
+        assert first == second
+
+    def test_new_message_invalidates_cache(self, session):
+        """Adding a message recomputes the stats."""
+        before = session.get_context_info()
+        session.add_message("system", "A new system message")
+        after = session.get_context_info()
+
+        assert after['messages'] == before['messages'] + 1
+
+    def test_returned_dict_is_a_copy(self, session):
+        """Mutating the returned dict does not corrupt the cache."""
+        info = session.get_context_info()
+        info['model'] = 'mutated'
+
+        assert session.get_context_info()['model'] != 'mutated'
+
+
+class TestFileContextCount:
+    """Test the incrementally maintained file context counter."""
+
+    def test_counts_user_added_file_messages(self, session):
+        """Only 'User added file' system messages are counted."""
+        session.add_message("system", "User added file 'a.py':\n\nprint('a')")
+        session.add_message("system", "User added file 'b.py':\n\nprint('b')")
+        session.add_message("system", "Some other system message")
+
+        assert session.file_context_count == 2
+
+    def test_duplicate_message_not_counted(self, session):
+        """Duplicate system messages are skipped by the context manager and not counted."""
+        session.add_message("system", "User added file 'a.py':\n\nprint('a')")
+        session.add_message("system", "User added file 'a.py':\n\nprint('a')")
+
+        assert session.file_context_count == 1
+
+    def test_clear_context_resets_count(self, session):
+        """Clearing the context resets the counter."""
+        session.add_message("system", "User added file 'a.py':\n\nprint('a')")
+        session.clear_context()
+
+        assert session.file_context_count == 0
+
+
+class TestIdempotentSwitches:
+    """Test that switching to the active model/mode does no work."""
+
+    def test_set_same_context_mode_is_noop(self, session):
+        """Setting the current mode doesn't touch the context manager."""
+        current = session.get_context_mode()
+        with patch.object(session.context_manager, 'set_mode') as set_mode:
+            session.set_context_mode(current)
+
+        set_mode.assert_not_called()
+
+    def test_set_different_context_mode(self, session):
+        """Setting a different mode is applied."""
+        session.set_context_mode("cache_optimized")
+        session.set_context_mode("smart_truncation")
+
+        assert session.get_context_mode() == "smart_truncation"
+
+    def test_switch_to_same_model_is_noop(self, session):
+        """Switching to the active model doesn't update the config."""
+        with patch.object(session.config, 'set_model') as set_model:
+            session.switch_model(session.model)
+
+        set_model.assert_not_called()
+
+
+class TestConversationHistoryCache:
+    """Test caching of the derived conversation history."""
+
+    def test_history_reused_until_context_changes(self, session):
+        """The history is built once until a message is added."""
+        with patch.object(session.context_manager, 'get_context_for_api',
+                          wraps=session.context_manager.get_context_for_api) as build:
+            first = session.get_conversation_history()
+            assert session.get_conversation_history() == first
+            assert build.call_count == 1
+
+            session.add_message("system", "Another system message")
+            second = session.get_conversation_history()
+
+            assert build.call_count == 2
+        assert session.message_count == len(second) == len(first) + 1
+
+    def test_returned_list_does_not_alter_cache(self, session):
+        history = session.get_conversation_history()
+        history.clear()
+
+        assert session.get_conversation_history()
+
+    def test_git_state_invalidates_cache(self, session):
+        with patch.object(session.context_manager, 'get_context_for_api',
+                          wraps=session.context_manager.get_context_for_api) as build:
+            session.get_conversation_history()
+            session.config.enable_git(branch="main")
+            session.get_conversation_history()
+
+            assert build.call_count == 2
+
+
+class TestLogHistory:
+    """Test that /log sees every message recorded in the conversation."""
+
+    @patch('src.ui.formatters.format_conversation_log')
+    @patch('src.ui.console.get_console')
+    def test_includes_model_reply_from_get_response(self, mock_console, mock_format, session):
+        session.client.chat.create.return_value.sample.return_value = Mock(content="hi there", tool_calls=None)
+
+        session.add_message("user", "hello")
+        session.get_response()
+        LogCommand(session.config).execute("/log", session)
+
+        shown = mock_format.call_args[0][0]
+        assert [(m["role"], m["content"]) for m in shown] == [("user", "hello"), ("assistant", "hi there")]
@@ -64,6 +64,47 @@ class TestStaleMountProblemFix:
         normalized_path = str(test_file.resolve())
         assert mounted_files[normalized_path].content == new_content
 
+    def test_unmount_file_removes_mount(self, mock_config, temp_dir):
+        """Verify that unmounting drops the file and reports whether it was mounted."""
+        test_file = temp_dir / "test.py"
+        test_file.write_text("content")
+
+        context_manager = ContextManager(mock_config)
+        context_manager.mount_file(str(test_file), "content")
+        version = context_manager.version
+
+        assert context_manager.unmount_file(str(test_file)) is True
+        assert context_manager.get_mounted_files() == {}
+        assert context_manager.version > version
+
+        # Second unmount finds nothing and leaves the version alone
+        version = context_manager.version
+        assert context_manager.unmount_file(str(test_file)) is False
+        assert context_manager.version == version
+
+    def test_mounted_context_rebuilt_only_after_mount_changes(self, mock_config, temp_dir):
+        """Verify that Layer 2 is cached and reflects mounts, refreshes and unmounts."""
+        test_file = temp_dir / "test.py"
+        test_file.write_text("old")
+        other_file = temp_dir / "other.py"
+        other_file.write_text("other")
+
+        context_manager = ContextManager(mock_config)
+        context_manager.mount_file(str(test_file), "old")
+        context_manager.mount_file(str(other_file), "other")
+
+        messages, tokens = context_manager._get_mounted_files_context()
+        assert tokens > 0
+        assert context_manager._get_mounted_files_context()[0] is messages
+
+        test_file.write_text("new")
+        context_manager.refresh_mounted_file_if_exists(str(test_file))
+        assert any(m["content"].endswith("new") for m in context_manager.get_context_for_api())
+
+        context_manager.unmount_file(str(test_file))
+        context_manager.unmount_file(str(other_file))
+        assert context_manager._get_mounted_files_context() == ([], 0)
+
     def test_refresh_nonexistent_mount_returns_false(self, mock_config, temp_dir):
         """Verify that refreshing a non-mounted file returns False."""
         test_file = temp_dir / "not_mounted.py"
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+
+"""
+Tests for UI formatting helpers
+"""
+
+from src.ui.formatters import make_table
+
+COLUMNS = (("Metric", "bright_cyan"), ("Value", "white", 20))
+
+
+def test_make_table_builds_columns():
+    """Columns carry the header, style and width from their spec."""
+    table = make_table("Stats", COLUMNS)
+
+    assert table.title == "Stats"
+    assert [c.header for c in table.columns] == ["Metric", "Value"]
+    assert [c.style for c in table.columns] == ["bright_cyan", "white"]
+    assert table.columns[1].width == 20
+
+
+def test_make_table_rows_do_not_leak_between_tables():
+    """Tables built from the same cached layout keep separate cells."""
+    first = make_table("Stats", COLUMNS)
+    first.add_row("Model", "grok")
+
+    second = make_table("Stats", COLUMNS)
+
+    assert first.row_count == 1
+    assert second.row_count == 0
+    assert list(second.columns[0].cells) == []
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+
+"""
+Tests for src.utils.file_utils module.
+
+Tests fuzzy file lookup.
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+from rapidfuzz import fuzz
+
+from src.utils import file_utils
+from src.utils.file_utils import (
+    _MMAP_READ_THRESHOLD,
+    _ratio_length_bounds,
+    _read_text_mapped,
+    find_best_matching_file,
+    invalidate_fuzzy_candidates,
+    safe_file_read,
+)
+
+
+@pytest.mark.utils
+class TestSafeFileRead:
+    """Test reading of large files through a memory map."""
+
+    @pytest.mark.parametrize("encoding", ["utf-8", "latin-1", "utf-16"])
+    def test_mapped_read_matches_text_mode(self, temp_dir, encoding):
+        path = temp_dir / "mixed.txt"
+        path.write_bytes("line one\r\nline two\rcafé\n".encode(encoding) + b"\xff")
+
+        with open(path, encoding=encoding, errors='replace') as f:
+            expected = f.read()
+
+        assert _read_text_mapped(str(path), encoding) == expected
+
+    def test_large_file_read(self, mock_config, temp_dir):
+        path = temp_dir / "large.py"
+        content = "x = 1\n" * (_MMAP_READ_THRESHOLD // 6 + 1)
+        path.write_text(content)
+
+        result = safe_file_read(str(path), config=mock_config)
+
+        assert result['success']
+        assert result['content'] == content
+
+
+@pytest.mark.utils
+class TestFindBestMatchingFile:
+    """Test fuzzy file path matching."""
+
+    def test_finds_close_match(self, mock_config, temp_dir):
+        """A misspelled path resolves to the closest file."""
+        (temp_dir / "src").mkdir()
+        (temp_dir / "src" / "session.py").write_text("")
+        (temp_dir / "README.md").write_text("")
+
+        result = find_best_matching_file(temp_dir, "src/sesion.py", mock_config)
+
+        assert result == str(temp_dir / "src" / "session.py")
+
+    def test_matching_ignores_case(self, mock_config, temp_dir):
+        (temp_dir / "Config.py").write_text("")
+
+        result = find_best_matching_file(temp_dir, "config.py", mock_config)
+
+        assert result == str(temp_dir / "Config.py")
+
+    def test_below_min_score_returns_none(self, mock_config, temp_dir):
+        (temp_dir / "session.py").write_text("")
+
+        assert find_best_matching_file(temp_dir, "unrelated.txt", mock_config) is None
+
+    def test_skips_excluded_files(self, mock_config, temp_dir):
+        (temp_dir / "node_modules").mkdir()
+        (temp_dir / "node_modules" / "index.js").write_text("")
+
+        assert find_best_matching_file(temp_dir, "node_modules/index.js", mock_config) is None
+
+    def test_unavailable_fuzzy_returns_none(self, mock_config, temp_dir):
+        (temp_dir / "session.py").write_text("")
+        mock_config.fuzzy_available = False
+
+        assert find_best_matching_file(temp_dir, "session.py", mock_config) is None
+
+    def test_length_prefilter_keeps_best_match(self, mock_config, temp_dir):
+        """Pruning by length doesn't change which file wins."""
+        (temp_dir / "app.py").write_text("")
+        (temp_dir / "application_settings_loader.py").write_text("")
+
+        assert find_best_matching_file(temp_dir, "ap.py", mock_config) == str(temp_dir / "app.py")
+
+    def test_unique_basename_matches_nested_file(self, mock_config, temp_dir):
+        """A bare file name finds its file in a subdirectory without scoring."""
+        (temp_dir / "src" / "core").mkdir(parents=True)
+        (temp_dir / "src" / "core" / "config.py").write_text("")
+
+        result = find_best_matching_file(temp_dir, "Config.py", mock_config)
+
+        assert result == str(temp_dir / "src" / "core" / "config.py")
+
+    def test_ambiguous_basename_falls_back_to_scoring(self, mock_config, temp_dir):
+        """A bare file name shared by several files is scored like any query."""
+        (temp_dir / "src").mkdir()
+        (temp_dir / "docs").mkdir()
+        (temp_dir / "src" / "config.py").write_text("")
+        (temp_dir / "docs" / "config.py").write_text("")
+
+        # The shorter path scores higher against the bare name
+        result = find_best_matching_file(temp_dir, "config.py", mock_config)
+
+        assert result == str(temp_dir / "src" / "config.py")
+
+
+@pytest.mark.utils
+class TestFuzzyCandidateCache:
+    """Test caching of the directory walk used for fuzzy matching."""
+
+    def test_walk_reused_while_tree_unchanged(self, mock_config, temp_dir):
+        (temp_dir / "session.py").write_text("")
+        find_best_matching_file(temp_dir, "sesion.py", mock_config)
+
+        with patch.object(file_utils.os, "walk", side_effect=AssertionError("rewalked")):
+            assert find_best_matching_file(temp_dir, "sesion.py", mock_config) == str(temp_dir / "session.py")
+
+    def test_new_nested_file_is_found(self, mock_config, temp_dir):
+        """Creating a file in a subdirectory invalidates the cached walk."""
+        (temp_dir / "src").mkdir()
+        (temp_dir / "src" / "main.py").write_text("")
+        assert find_best_matching_file(temp_dir, "src/sesion.py", mock_config) is None
+
+        (temp_dir / "src" / "session.py").write_text("")
+        os.utime(temp_dir / "src", ns=(0, 0))  # Guard against coarse mtime resolution
+
+        assert find_best_matching_file(temp_dir, "src/sesion.py", mock_config) == str(temp_dir / "src" / "session.py")
+
+    def test_invalidate_forgets_directory(self, mock_config, temp_dir):
+        (temp_dir / "session.py").write_text("")
+        find_best_matching_file(temp_dir, "sesion.py", mock_config)
+
+        invalidate_fuzzy_candidates(temp_dir)
+
+        assert temp_dir not in file_utils._CANDIDATES_CACHE
+
+
+@pytest.mark.utils
+class TestRatioLengthBounds:
+    """Test the fuzz.ratio length bound used to prefilter candidates."""
+
+    def test_bounds_are_tight(self):
+        low, high = _ratio_length_bounds(8, 80)
+
+        # Strings at the bounds can still reach the score, just outside cannot
+        assert fuzz.ratio("a" * 8, "a" * 6) >= 80 and low <= 6
+        assert fuzz.ratio("a" * 8, "a" * 5) < 80 and low > 5
+        assert fuzz.ratio("a" * 8, "a" * 12) >= 80 and high >= 12
+        assert fuzz.ratio("a" * 8, "a" * 13) < 80 and high < 13
+
+    def test_zero_score_keeps_everything(self):
+        assert _ratio_length_bounds(5, 0) == (0, float("inf"))